@@ -25,6 +25,7 @@ Usage:
 import argparse
 import asyncio
 import csv
+import heapq
 import json
 import os
 import re
@@ -34,10 +35,12 @@ import time
 import urllib.error
 import urllib.parse
 import urllib.request
-from collections import defaultdict
+from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from difflib import SequenceMatcher
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 # Local module for #218 enrichment-provenance constants (tier_for, detail values).
@@ -49,8 +52,17 @@ from lib import enrichment_methods as em  # noqa: E402
 # Load .env from project root (no external dependency)
 # ---------------------------------------------------------------------------
 _env_file = Path(__file__).resolve().parents[2] / ".env"
-if _env_file.exists():
-    for raw_line in _env_file.read_text().splitlines():
+
+
+def _load_env_file(path: Path = _env_file) -> None:
+    """Populate os.environ from ``path`` without overriding existing keys.
+
+    Called from ``main()`` only, so tests and other importers of this module
+    don't pay for (or get side effects from) the file read.
+    """
+    if not path.exists():
+        return
+    for raw_line in path.read_text().splitlines():
         stripped = raw_line.strip()
         if stripped and not stripped.startswith("#") and "=" in stripped:
             key, _, value = stripped.partition("=")
@@ -168,11 +180,21 @@ def fetch_json(url: str, headers: dict | None = None, retries: int = 3) -> dict:
     return {}
 
 
+# Longer GET URLs are sent as a form POST instead; WDQS/nginx reject request
+# lines beyond ~8 KB, which large VALUES blocks easily exceed.
+SPARQL_GET_MAX_URL = 6000
+
+
 def sparql_query(endpoint: str, query: str, retries: int = 3) -> list[dict]:
     """Execute a SPARQL query and return results bindings."""
     params = urllib.parse.urlencode({"query": query, "format": "json"})
     url = f"{endpoint}?{params}"
-    data = fetch_json(url, {"Accept": "application/sparql-results+json"}, retries)
+    if len(url) > SPARQL_GET_MAX_URL:
+        data = _http_post_json(endpoint, {"query": query, "format": "json"},
+                               extra_headers=_SPARQL_JSON_HEADERS,
+                               retries=retries, timeout=60, retry_label="SPARQL")
+    else:
+        data = fetch_json(url, {"Accept": "application/sparql-results+json"}, retries)
     return data.get("results", {}).get("bindings", [])
 
 
@@ -433,18 +455,17 @@ def update_coords(conn: sqlite3.Connection,
     if dry_run or not updates:
         return 0
     coord_tier = em.tier_for(coord_method_detail)  # raises on unknown — fail fast
-    cursor = conn.cursor()
-    updated = 0
-    for vocab_id, (lat, lon) in updates.items():
-        cursor.execute(
-            "UPDATE vocabulary SET lat = ?, lon = ?, "
-            "coord_method = ?, coord_method_detail = ? "
-            "WHERE id = ? AND lat IS NULL",
-            (lat, lon, coord_tier, coord_method_detail, vocab_id),
-        )
-        updated += cursor.rowcount
+    # executemany sums rowcount across all parameter sets, so the count still
+    # reflects only the rows the lat IS NULL guard let through.
+    cursor = conn.executemany(
+        "UPDATE vocabulary SET lat = ?, lon = ?, "
+        "coord_method = ?, coord_method_detail = ? "
+        "WHERE id = ? AND lat IS NULL",
+        ((lat, lon, coord_tier, coord_method_detail, vocab_id)
+         for vocab_id, (lat, lon) in updates.items()),
+    )
     conn.commit()
-    return updated
+    return cursor.rowcount
 
 
 def update_coords_and_ids(conn: sqlite3.Connection,
@@ -462,20 +483,17 @@ def update_coords_and_ids(conn: sqlite3.Connection,
         return 0
     coord_tier = em.tier_for(coord_method_detail)
     ext_id_tier = em.tier_for(external_id_method_detail)
-    cursor = conn.cursor()
-    updated = 0
-    for vocab_id, (lat, lon, ext_id) in updates.items():
-        cursor.execute(
-            "UPDATE vocabulary SET lat = ?, lon = ?, external_id = ?, "
-            "coord_method = ?, coord_method_detail = ?, "
-            "external_id_method = ?, external_id_method_detail = ? "
-            "WHERE id = ? AND lat IS NULL",
-            (lat, lon, ext_id, coord_tier, coord_method_detail,
-             ext_id_tier, external_id_method_detail, vocab_id),
-        )
-        updated += cursor.rowcount
+    cursor = conn.executemany(
+        "UPDATE vocabulary SET lat = ?, lon = ?, external_id = ?, "
+        "coord_method = ?, coord_method_detail = ?, "
+        "external_id_method = ?, external_id_method_detail = ? "
+        "WHERE id = ? AND lat IS NULL",
+        ((lat, lon, ext_id, coord_tier, coord_method_detail,
+          ext_id_tier, external_id_method_detail, vocab_id)
+         for vocab_id, (lat, lon, ext_id) in updates.items()),
+    )
     conn.commit()
-    return updated
+    return cursor.rowcount
 
 
 def filter_reconcilable(places: list[dict]) -> tuple[list[tuple[str, str]], int]:
@@ -705,13 +723,14 @@ def phase_1b_wikidata_alt(conn: sqlite3.Connection,
     if dry_run:
         return 0
 
-    # Per-result: {vocab_id: (lat, lon, detail)}. Priority order enforces
-    # P159 > P276 > P131 if a QID has multiple alt-paths.
-    PROP_PRIORITY = {em.WIKIDATA_P159: 0, em.WIKIDATA_P276: 1, em.WIKIDATA_P131: 2}
-    PROP_FROM_SPARQL = {
-        "P159": em.WIKIDATA_P159,
-        "P276": em.WIKIDATA_P276,
-        "P131": em.WIKIDATA_P131,
+    # Per-result: {qid: (lat, lon, detail)}, fanned out to vocab_ids below.
+    # Priority order enforces P159 > P276 > P131 if a QID has multiple
+    # alt-paths; the query returns ?prio as a literal ("1"-"3"), which is
+    # looked up as a string key in this dict to get the method detail.
+    PROP_BY_PRIO = {
+        "1": em.WIKIDATA_P159,
+        "2": em.WIKIDATA_P276,
+        "3": em.WIKIDATA_P131,
     }
     per_qid: dict[str, tuple[float, float, str]] = {}
     qids = list(qid_to_vocab.keys())
@@ -721,43 +740,40 @@ def phase_1b_wikidata_alt(conn: sqlite3.Connection,
         batch = qids[i:i + batch_size]
         values = " ".join(f"wd:{qid}" for qid in batch)
 
-        # Same three UNION branches as before, now with a ?prop binding so
-        # we know which path produced each coordinate.
+        # The inner GROUP BY picks the best (lowest) priority per item, and
+        # the outer join only returns coordinates for that property. Admin
+        # chains (P131) are deep and the old three-way UNION returned every
+        # path for every item; this keeps the response to ~1 row per QID.
         query = f"""
-        SELECT ?item ?lat ?lon ?prop WHERE {{
-          VALUES ?item {{ {values} }}
+        SELECT ?item ?lat ?lon ?prio WHERE {{
           {{
-            ?item wdt:P159 ?hq .
-            ?hq wdt:P625 ?coord .
-            BIND("P159" AS ?prop)
-          }} UNION {{
-            ?item wdt:P276 ?loc .
-            ?loc wdt:P625 ?coord .
-            BIND("P276" AS ?prop)
-          }} UNION {{
-            ?item wdt:P131 ?admin .
-            ?admin wdt:P625 ?coord .
-            BIND("P131" AS ?prop)
+            SELECT ?item (MIN(?p) AS ?prio) WHERE {{
+              VALUES ?item {{ {values} }}
+              VALUES (?prop ?p) {{ (wdt:P159 1) (wdt:P276 2) (wdt:P131 3) }}
+              ?item ?prop ?target .
+              ?target wdt:P625 [] .
+            }} GROUP BY ?item
           }}
+          VALUES (?prop ?prio) {{ (wdt:P159 1) (wdt:P276 2) (wdt:P131 3) }}
+          ?item ?prop ?target .
+          ?target wdt:P625 ?coord .
           BIND(geof:latitude(?coord) AS ?lat)
           BIND(geof:longitude(?coord) AS ?lon)
         }}
+        ORDER BY ?item
         """
 
         try:
             bindings = sparql_query(WIKIDATA_SPARQL, query)
             for b in bindings:
                 qid = b["item"]["value"].rsplit("/", 1)[-1]
-                lat = float(b["lat"]["value"])
-                lon = float(b["lon"]["value"])
-                prop_raw = b["prop"]["value"]
-                detail = PROP_FROM_SPARQL.get(prop_raw)
+                if qid in per_qid:
+                    continue  # first row per QID wins; all share the best prio
+                detail = PROP_BY_PRIO.get(b["prio"]["value"])
                 if detail is None:
                     continue
-                # Keep the highest-priority (lowest number) detail per QID.
-                existing = per_qid.get(qid)
-                if existing is None or PROP_PRIORITY[detail] < PROP_PRIORITY[existing[2]]:
-                    per_qid[qid] = (lat, lon, detail)
+                per_qid[qid] = (float(b["lat"]["value"]),
+                                float(b["lon"]["value"]), detail)
 
             print(f"  Batch {i // batch_size + 1}: {len(batch)} QIDs → "
                   f"{len(bindings)} with alt coords", file=sys.stderr)
@@ -1185,6 +1201,15 @@ def string_similarity(a: str, b: str) -> float:
     b_norm = b.lower().strip()
     if a_norm == b_norm:
         return 100.0
+    return _sequence_ratio(a_norm, b_norm)
+
+
+@lru_cache(maxsize=200_000)
+def _sequence_ratio(a_norm: str, b_norm: str) -> float:
+    # Memoized: the same (name, label) pairs recur across candidates and
+    # across Phase 3 / 3b-3 / 3b-bridge. Deliberately still difflib, not
+    # rapidfuzz: its Indel ratio scores unrelated labels up to ~35 points
+    # higher, which would shift the calibrated 80/60/50 decision bands.
     return SequenceMatcher(None, a_norm, b_norm).ratio() * 100
 
 
@@ -1367,12 +1392,88 @@ def _search_wikidata_sync(names: list[tuple[str, str]]
     return results
 
 
+# Phase 3b QID metadata cache. Candidate QIDs repeat heavily across runs
+# (same unresolved names → same search hits), so validated P31/P17/P131/
+# P625/label rows are kept in a small SQLite file next to the phase
+# outputs and reused until they are older than QID_CACHE_MAX_AGE_S.
+QID_CACHE_FILENAME = "wikidata_qid_cache.db"
+QID_CACHE_MAX_AGE_S = 30 * 24 * 3600
+
+_QID_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS wd_cache (
+    qid         TEXT PRIMARY KEY,
+    types       TEXT,
+    country     TEXT,
+    admin       TEXT,
+    lat         REAL,
+    lon         REAL,
+    label       TEXT,
+    fetched_at  INTEGER NOT NULL
+)
+"""
+
+
+def _open_qid_cache(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cache = sqlite3.connect(str(path))
+    cache.execute(_QID_CACHE_SCHEMA)
+    return cache
+
+
+def _load_cached_qids(cache: sqlite3.Connection, qids: set[str],
+                      max_age_s: int = QID_CACHE_MAX_AGE_S
+                      ) -> tuple[dict[str, dict], set[str]]:
+    """Split ``qids`` into (fresh cache hits as qid_info dicts, misses)."""
+    cutoff = int(time.time()) - max_age_s
+    hits: dict[str, dict] = {}
+    qid_list = list(qids)
+    # Stay under SQLite's default bound-parameter limit.
+    for i in range(0, len(qid_list), 900):
+        chunk = qid_list[i:i + 900]
+        placeholders = ",".join("?" * len(chunk))
+        for qid, types, country, admin, lat, lon, label in cache.execute(
+            "SELECT qid, types, country, admin, lat, lon, label FROM wd_cache "
+            f"WHERE fetched_at > ? AND qid IN ({placeholders})",
+            (cutoff, *chunk),
+        ):
+            hits[qid] = {
+                "types": types.split(",") if types else [],
+                "country_qid": country,
+                "admin_qid": admin,
+                "lat": lat,
+                "lon": lon,
+                "label": label,
+            }
+    return hits, qids - hits.keys()
+
+
+def _store_cached_qids(cache: sqlite3.Connection,
+                       qid_info: dict[str, dict]) -> None:
+    now = int(time.time())
+    cache.executemany(
+        "INSERT OR REPLACE INTO wd_cache "
+        "(qid, types, country, admin, lat, lon, label, fetched_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [(qid, ",".join(sorted(info["types"])), info["country_qid"],
+          info["admin_qid"], info["lat"], info["lon"], info["label"], now)
+         for qid, info in qid_info.items()],
+    )
+    cache.commit()
+
+
 def validate_candidates_sparql(candidates: dict[str, list[dict]],
-                               batch_size: int = 300
+                               batch_size: int = 500,
+                               cache_path: Path | None = None,
+                               refresh: bool = False,
                                ) -> dict[str, dict]:
     """
     Fetch P31, P17, P625, P131, labels for all candidate QIDs via SPARQL.
     Returns {qid: {types: [...], country_qid, lat, lon, label, admin_qid}}.
+
+    With ``cache_path`` set, QIDs validated within the last
+    ``QID_CACHE_MAX_AGE_S`` are served from that SQLite file and only the
+    misses go to WDQS; fresh results are written back. ``refresh=True``
+    ignores existing entries (but still refreshes the cache).
     """
     # Collect all unique QIDs
     all_qids = set()
@@ -1383,6 +1484,13 @@ def validate_candidates_sparql(candidates: dict[str, list[dict]],
     if not all_qids:
         return {}
 
+    cache = _open_qid_cache(cache_path) if cache_path else None
+    cached: dict[str, dict] = {}
+    if cache is not None and not refresh:
+        cached, all_qids = _load_cached_qids(cache, all_qids)
+        print(f"  QID cache: {len(cached)} hits, {len(all_qids)} to fetch",
+              file=sys.stderr)
+
     print(f"  Validating {len(all_qids)} candidate QIDs via SPARQL",
           file=sys.stderr)
 
@@ -1393,45 +1501,47 @@ def validate_candidates_sparql(candidates: dict[str, list[dict]],
         batch = qid_list[i:i + batch_size]
         values = " ".join(f"wd:{q}" for q in batch)
 
+        # One row per QID: the OPTIONALs below fan out as
+        # |P625| x |P31| x |P17| x |P131| per item, so aggregate server-side
+        # instead of shipping the cross product. SAMPLE(?coord) keeps lat
+        # and lon from the same statement.
         query = f"""
-        SELECT ?item ?coord ?lat ?lon ?type ?country ?admin ?label WHERE {{
+        SELECT ?item (SAMPLE(?coord) AS ?point)
+               (GROUP_CONCAT(DISTINCT STR(?type); separator=" ") AS ?types)
+               (SAMPLE(?country) AS ?country_) (SAMPLE(?admin) AS ?admin_)
+               (SAMPLE(?label) AS ?label_)
+        WHERE {{
           VALUES ?item {{ {values} }}
-          OPTIONAL {{ ?item wdt:P625 ?coord .
-                      BIND(geof:latitude(?coord) AS ?lat)
-                      BIND(geof:longitude(?coord) AS ?lon) }}
+          OPTIONAL {{ ?item wdt:P625 ?coord }}
           OPTIONAL {{ ?item wdt:P31 ?type }}
           OPTIONAL {{ ?item wdt:P17 ?country }}
           OPTIONAL {{ ?item wdt:P131 ?admin }}
           OPTIONAL {{ ?item rdfs:label ?label . FILTER(LANG(?label) = "en") }}
         }}
+        GROUP BY ?item
         """
 
         try:
             bindings = sparql_query(WIKIDATA_SPARQL, query)
             for b in bindings:
                 qid = b["item"]["value"].rsplit("/", 1)[-1]
-                if qid not in qid_info:
-                    qid_info[qid] = {
-                        "types": set(),
-                        "country_qid": None,
-                        "admin_qid": None,
-                        "lat": None,
-                        "lon": None,
-                        "label": None,
-                    }
-                info = qid_info[qid]
-
-                if "type" in b:
-                    info["types"].add(b["type"]["value"].rsplit("/", 1)[-1])
-                if "country" in b and not info["country_qid"]:
-                    info["country_qid"] = b["country"]["value"].rsplit("/", 1)[-1]
-                if "admin" in b and not info["admin_qid"]:
-                    info["admin_qid"] = b["admin"]["value"].rsplit("/", 1)[-1]
-                if "lat" in b and info["lat"] is None:
-                    info["lat"] = float(b["lat"]["value"])
-                    info["lon"] = float(b["lon"]["value"])
-                if "label" in b and not info["label"]:
-                    info["label"] = b["label"]["value"]
+                info = {
+                    "types": {t.rsplit("/", 1)[-1]
+                              for t in b.get("types", {}).get("value", "").split()},
+                    "country_qid": None,
+                    "admin_qid": None,
+                    "lat": None,
+                    "lon": None,
+                    "label": b.get("label_", {}).get("value") or None,
+                }
+                if "country_" in b:
+                    info["country_qid"] = b["country_"]["value"].rsplit("/", 1)[-1]
+                if "admin_" in b:
+                    info["admin_qid"] = b["admin_"]["value"].rsplit("/", 1)[-1]
+                m = _WKT_POINT_RE.match(b.get("point", {}).get("value", ""))
+                if m:
+                    info["lon"], info["lat"] = float(m.group(1)), float(m.group(2))
+                qid_info[qid] = info
 
             print(f"  SPARQL batch {i // batch_size + 1}: "
                   f"{len(batch)} QIDs queried", file=sys.stderr)
@@ -1445,6 +1555,11 @@ def validate_candidates_sparql(candidates: dict[str, list[dict]],
     for info in qid_info.values():
         info["types"] = list(info["types"])
 
+    if cache is not None:
+        _store_cached_qids(cache, qid_info)
+        cache.close()
+        qid_info.update(cached)
+
     return qid_info
 
 
@@ -1500,10 +1615,14 @@ def score_candidate(name: str, candidate: dict, qid_info: dict) -> float:
 
 def phase_3_reconciliation(conn: sqlite3.Connection,
                            dry_run: bool = False,
-                           output_dir: str = "offline/geo") -> int:
+                           output_dir: str = "offline/geo",
+                           refresh_qid_cache: bool = False) -> int:
     """
     Reconcile unmatched place names to Wikidata entities.
     Outputs accepted/review/rejected CSVs and applies accepted matches.
+
+    Candidate QID metadata is cached in ``<output_dir>/wikidata_qid_cache.db``
+    across runs; ``refresh_qid_cache=True`` re-fetches every QID.
     """
     places = get_ungeocoded(conn, "no_external_used")
     if not places:
@@ -1518,32 +1637,41 @@ def phase_3_reconciliation(conn: sqlite3.Connection,
     if dry_run:
         return 0
 
-    # Step 3a: Search Wikidata for candidates
-    print("Phase 3a: Searching Wikidata entities...", file=sys.stderr)
-    search_results = asyncio.run(
-        search_wikidata_entities(candidates_input, concurrency=5)
+    # Step 3a: Search Wikidata for candidates — once per distinct name, then
+    # shared by every vocab_id with that name (QIDs are deduped in 3b).
+    distinct_names = list(dict.fromkeys(name for _, name in candidates_input))
+    print(f"Phase 3a: Searching Wikidata entities "
+          f"({len(distinct_names)} distinct names)...", file=sys.stderr)
+    results_by_name = asyncio.run(
+        search_wikidata_entities([(n, n) for n in distinct_names], concurrency=5)
     )
 
     # Count how many found candidates
-    with_candidates = sum(1 for v in search_results.values() if v)
+    with_candidates = sum(1 for _, name in candidates_input
+                          if results_by_name.get(name))
     print(f"  Found candidates for {with_candidates}/{len(candidates_input)} places",
           file=sys.stderr)
 
     # Step 3b: Validate all candidates via SPARQL
     print("Phase 3b: Validating candidates via SPARQL...", file=sys.stderr)
-    qid_info = validate_candidates_sparql(search_results)
+    qid_info = validate_candidates_sparql(
+        results_by_name,
+        cache_path=Path(output_dir) / QID_CACHE_FILENAME,
+        refresh=refresh_qid_cache,
+    )
 
     # Step 3c: Score and classify
     print("Phase 3c: Scoring candidates...", file=sys.stderr)
     accepted = []   # (vocab_id, name, qid, lat, lon, score)
-    review = []     # (vocab_id, name, candidates_with_scores)
+    review = []     # (vocab_id, name, top-2 candidates_with_scores)
     rejected = []   # (vocab_id, name, reason)
 
-    # Build name lookup
-    name_lookup = {vid: name for vid, name in candidates_input}
+    # vocab_ids sharing a name share a candidate list (3a dedup), so the same
+    # (name, qid) pair is scored repeatedly; qid_info is fixed for the run.
+    score_cache: dict[tuple[str, str], float] = {}
 
-    for vocab_id, cands in search_results.items():
-        name = name_lookup.get(vocab_id, "")
+    for vocab_id, name in candidates_input:
+        cands = results_by_name.get(name, [])
         if not cands:
             rejected.append((vocab_id, name, "no_candidates"))
             continue
@@ -1551,7 +1679,10 @@ def phase_3_reconciliation(conn: sqlite3.Connection,
         # Score each candidate
         scored = []
         for c in cands:
-            score = score_candidate(name, c, qid_info)
+            key = (name, c["qid"])
+            score = score_cache.get(key)
+            if score is None:
+                score = score_cache[key] = score_candidate(name, c, qid_info)
             info = qid_info.get(c["qid"], {})
             scored.append({
                 **c,
@@ -1563,18 +1694,20 @@ def phase_3_reconciliation(conn: sqlite3.Connection,
                 "label_en": info.get("label"),
             })
 
-        scored.sort(key=lambda x: x["score"], reverse=True)
-        top = scored[0]
+        # Only the top two matter (decision gap + review CSV columns);
+        # nlargest is stable, so ties keep the same order as a full sort.
+        top_two = heapq.nlargest(2, scored, key=itemgetter("score"))
+        top = top_two[0]
 
         # Decision thresholds
-        gap = top["score"] - scored[1]["score"] if len(scored) > 1 else 100
+        gap = top["score"] - top_two[1]["score"] if len(top_two) > 1 else 100
         has_coords = top["lat"] is not None
 
         if top["score"] >= 80 and has_coords and gap >= 20:
             accepted.append((vocab_id, name, top["qid"],
                              top["lat"], top["lon"], top["score"]))
         elif top["score"] >= 60 or (has_coords and top["score"] >= 50):
-            review.append((vocab_id, name, scored))
+            review.append((vocab_id, name, top_two))
         else:
             rejected.append((vocab_id, name, f"low_score:{top['score']:.0f}"))
 
@@ -1589,8 +1722,7 @@ def phase_3_reconciliation(conn: sqlite3.Connection,
     with open(out / "reconciled_accepted.csv", "w", newline="") as f:
         w = csv.writer(f)
         w.writerow(["vocab_id", "name", "qid", "lat", "lon", "score"])
-        for row in accepted:
-            w.writerow(row)
+        w.writerows(accepted)
     print(f"  Wrote {out / 'reconciled_accepted.csv'} ({len(accepted)} entries)",
           file=sys.stderr)
 
@@ -1621,8 +1753,7 @@ def phase_3_reconciliation(conn: sqlite3.Connection,
     with open(out / "reconciled_rejected.csv", "w", newline="") as f:
         w = csv.writer(f)
         w.writerow(["vocab_id", "name", "reason"])
-        for row in rejected:
-            w.writerow(row)
+        w.writerows(rejected)
     print(f"  Wrote {out / 'reconciled_rejected.csv'} ({len(rejected)} entries)",
           file=sys.stderr)
 
@@ -2914,28 +3045,53 @@ def phase_3e_pleiades(conn: sqlite3.Connection,
 # Phase 4: Validation
 # ---------------------------------------------------------------------------
 
+# Known Dutch cities for the lat/lon swap check. Exact match only, to avoid
+# false positives like "Amsterdamse Poort" (Jakarta) or "Dordrecht" (South
+# Africa).
+DUTCH_CITIES = frozenset({
+    "amsterdam", "rotterdam", "den haag", "utrecht", "leiden", "haarlem",
+    "delft", "groningen", "breda", "maastricht", "dordrecht",
+})
+
+# Caribbean/Suriname territories: exact match, "<kw> ..." / "<kw>, ..."
+# prefix, or a whole-word hit on the island names anywhere in the label.
+# Avoids false positives like "Sint-Maartenskerk" in NL.
+CARIBBEAN_KEYWORDS = ("curaçao", "curacao", "bonaire", "sint-eustatius",
+                      "sint maarten", "aruba", "suriname")
+CARIBBEAN_RE = re.compile(
+    r"^(?:" + "|".join(map(re.escape, CARIBBEAN_KEYWORDS)) + r")(?:\Z|[ ,])"
+    r"|\b(?:curaçao|curacao|bonaire|aruba)\b"
+)
+
+# One validation_report.md table row per issue dict
+_REPORT_ROW_FMT = "| {id} | {name} | {lat} | {lon} | {detail} |".format
+
+
 def phase_4_validation(conn: sqlite3.Connection,
                        output_dir: str = "offline/geo") -> list[dict]:
     """
     Validate all geocoded places. Returns list of issues found.
     Writes validation_report.md.
     """
-    rows = conn.execute("""
-        SELECT id, label_en, label_nl, lat, lon, external_id,
+    issues: list[dict] = []
+
+    # Count rows per rounded coordinate for the duplicate check. Only the
+    # first (id, name) is held per coordinate; a sample list (capped at the
+    # five the report shows) is started once a coordinate repeats, so the
+    # common all-unique case allocates no per-coordinate lists.
+    coord_counts: Counter[tuple[float, float]] = Counter()
+    coord_first: dict[tuple[float, float], tuple[str, str]] = {}
+    coord_samples: dict[tuple[float, float], list[tuple[str, str]]] = {}
+
+    n_rows = 0
+    # Stream the cursor rather than materialising every row up front
+    for row in conn.execute("""
+        SELECT id, lat, lon,
                COALESCE(NULLIF(label_en, ''), label_nl) AS name
         FROM vocabulary
         WHERE type = 'place' AND lat IS NOT NULL
-    """).fetchall()
-
-    print(f"Phase 4: Validating {len(rows)} geocoded places", file=sys.stderr)
-
-    issues: list[dict] = []
-
-    # Track coordinates for duplicate check
-    coord_map: dict[tuple[float, float], list[dict]] = defaultdict(list)
-
-    for r in rows:
-        row = dict(r)
+    """):
+        n_rows += 1
         lat, lon = row["lat"], row["lon"]
         name = row["name"] or ""
 
@@ -2967,15 +3123,8 @@ def phase_4_validation(conn: sqlite3.Connection,
             })
 
         # 4. Lat/lon swap detection for known Dutch cities
-        #    Use exact match or word boundary to avoid false positives like
-        #    "Amsterdamse Poort" (Jakarta) or "Dordrecht" (South Africa)
-        dutch_cities = {"amsterdam", "rotterdam", "den haag", "utrecht",
-                        "leiden", "haarlem", "delft", "groningen",
-                        "breda", "maastricht", "dordrecht"}
         name_lower = name.lower()
-        is_dutch_city = (name_lower in dutch_cities or
-                         any(name_lower == f"{c}" for c in dutch_cities))
-        if is_dutch_city:
+        if name_lower in DUTCH_CITIES:
             # Dutch places should be ~47-54°N, 3-7°E
             if not (47 <= lat <= 54 and 3 <= lon <= 8):
                 # Check if swapped
@@ -2995,18 +3144,8 @@ def phase_4_validation(conn: sqlite3.Connection,
                         "detail": f"Dutch place with negative latitude: {lat}",
                     })
 
-        # 5. Caribbean territories check (exact match or starts-with to
-        #    avoid false positives like "Sint-Maartenskerk" in NL)
-        caribbean_keywords = {"curaçao", "curacao", "bonaire", "sint-eustatius",
-                              "sint maarten", "aruba", "suriname"}
-        is_caribbean = (name_lower in caribbean_keywords or
-                        name_lower.startswith(tuple(
-                            f"{kw} " for kw in caribbean_keywords)) or
-                        name_lower.startswith(tuple(
-                            f"{kw}," for kw in caribbean_keywords)) or
-                        re.search(r'\b(?:curaçao|curacao|bonaire|aruba)\b',
-                                  name_lower))
-        if is_caribbean:
+        # 5. Caribbean territories check
+        if CARIBBEAN_RE.search(name_lower):
             if not (10 <= lat <= 20 and -71 <= lon <= -55):
                 if not (-10 <= lat <= 10 and -60 <= lon <= -45):
                     # Could also be Suriname
@@ -3018,24 +3157,36 @@ def phase_4_validation(conn: sqlite3.Connection,
                     })
 
         # Collect for duplicate check
-        coord_key = (round(lat, 4), round(lon, 4))
-        coord_map[coord_key].append(row)
+        coord = (round(lat, 4), round(lon, 4))
+        coord_counts[coord] += 1
+        n = coord_counts[coord]
+        if n == 1:
+            coord_first[coord] = (row["id"], row["name"])
+        elif n == 2:
+            coord_samples[coord] = [coord_first[coord], (row["id"], row["name"])]
+        elif n <= 5:
+            coord_samples[coord].append((row["id"], row["name"]))
+
+    print(f"Phase 4: Validated {n_rows} geocoded places", file=sys.stderr)
 
     # 6. Duplicate coordinate check (5+ entries at same point, excluding (0,0))
-    for coord, entries in coord_map.items():
-        if len(entries) >= 5 and coord != (0.0, 0.0):
-            names = [e["name"] for e in entries[:5]]
-            # Only flag if names look unrelated
-            name_set = {n.lower().split()[0] if n else "" for n in names}
-            if len(name_set) >= 3:
-                issues.append({
-                    "id": entries[0]["id"],
-                    "name": f"{len(entries)} entries",
-                    "lat": coord[0], "lon": coord[1],
-                    "issue": "duplicate_coords",
-                    "detail": f"{len(entries)} places at ({coord[0]}, {coord[1]}): "
-                              f"{', '.join(names[:5])}...",
-                })
+    # Walk coord_counts (first-seen order) so issues keep the original order.
+    for coord, count in coord_counts.items():
+        if count < 5 or coord == (0.0, 0.0):
+            continue
+        entries = coord_samples[coord]
+        names = [n for _, n in entries]
+        # Only flag if names look unrelated
+        name_set = {n.lower().split()[0] if n else "" for n in names}
+        if len(name_set) >= 3:
+            issues.append({
+                "id": entries[0][0],
+                "name": f"{count} entries",
+                "lat": coord[0], "lon": coord[1],
+                "issue": "duplicate_coords",
+                "detail": f"{count} places at ({coord[0]}, {coord[1]}): "
+                          f"{', '.join(names)}...",
+            })
 
     # Write report
     out = Path(output_dir)
@@ -3064,11 +3215,8 @@ def phase_4_validation(conn: sqlite3.Connection,
             report_lines.append("")
             report_lines.append("| ID | Name | Lat | Lon | Detail |")
             report_lines.append("|---|---|---|---|---|")
-            for item in items[:50]:  # Cap at 50 per type
-                report_lines.append(
-                    f"| {item['id']} | {item['name']} | "
-                    f"{item['lat']} | {item['lon']} | {item['detail']} |"
-                )
+            report_lines.extend(  # Cap at 50 per type
+                _REPORT_ROW_FMT(**item) for item in items[:50])
             if len(items) > 50:
                 report_lines.append(f"| ... | *{len(items) - 50} more* | | | |")
     else:
@@ -3148,6 +3296,7 @@ def export_backfill_csv(conn: sqlite3.Connection, csv_path: str) -> int:
 # ---------------------------------------------------------------------------
 
 def main():
+    _load_env_file()
     parser = argparse.ArgumentParser(
         description="Geocode remaining places in the vocabulary DB",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -3183,6 +3332,9 @@ Examples:
                         help="GeoNames API username (or set GEONAMES_USERNAME env var)")
     parser.add_argument("--skip-whg", action="store_true",
                         help="Skip Phase 3b (WHG reconciliation)")
+    parser.add_argument("--refresh-qid-cache", action="store_true",
+                        help="Phase 3: ignore the local Wikidata QID cache "
+                             "and re-validate every candidate via SPARQL")
     parser.add_argument("--csv-only", action="store_true",
                         help="Write output CSVs but don't apply matches to DB")
     parser.add_argument("--apply-reviewed",
@@ -3320,7 +3472,7 @@ Examples:
         print(f"\n--- Phase 3: Wikidata entity reconciliation ---",
               file=sys.stderr)
         total_updated += phase_3_reconciliation(
-            conn, args.dry_run, args.output_dir)
+            conn, args.dry_run, args.output_dir, args.refresh_qid_cache)
 
     # Phase 3b: World Historical Gazetteer reconciliation (requires WHG_TOKEN)
     if run_phase in (None, "3b") and not args.skip_whg:
@@ -48,6 +48,10 @@ spec = importlib.util.spec_from_file_location(
 )
 geocode_mod = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(geocode_mod)
+# geocode_places only reads .env from its own main(); this script needs
+# WHG_TOKEN / GEONAMES_USERNAME in os.environ before its main() runs, so
+# load it here.
+geocode_mod._load_env_file()
 
 from lib import enrichment_methods as em  # noqa: E402
 
@@ -11,33 +11,72 @@ Writes are always `INSERT OR IGNORE` and never delete existing rows; persons
 already present in `person_names` are skipped by default. Run as often as
 you like — it is idempotent and cannot lose data on partial failure.
 
+Fetches run concurrently via aiohttp (bounded by --concurrency) when it is
+installed, and fall back to a sequential urllib loop otherwise. --workers N
+spreads fetching and JSON parsing over N processes. SQLite writes always
+happen on the main thread, once per BATCH_SIZE persons, and are
+committed every COMMIT_EVERY persons.
+
+Successful Linked Art responses are cached gzip-compressed under
+data/linkedart-cache/ (LA_CACHE_TTL_S, default 30 days), so a rerun after a
+failed or interrupted harvest only re-parses what it already downloaded.
+--refetch-all skips cache reads (it exists to pick up upstream changes) but
+still writes the fresh responses back.
+
 Usage:
     python3 scripts/harvest-person-names.py                    # Default: data/vocabulary.db
     python3 scripts/harvest-person-names.py --db path/to.db    # Custom DB path
     python3 scripts/harvest-person-names.py --refetch-all      # Re-fetch every person (still INSERT OR IGNORE)
+    python3 scripts/harvest-person-names.py --concurrency 32   # More in-flight requests
+    python3 scripts/harvest-person-names.py --workers 4        # Fetch + parse in 4 processes
+    python3 scripts/harvest-person-names.py --no-cache         # Bypass the Linked Art response cache
 """
 
 import argparse
+import asyncio
+import functools
+import gzip
 import json
+import multiprocessing
+import os
 import sqlite3
+import sys
 import time
 import urllib.request
 from pathlib import Path
 
+try:
+    # Optional: orjson parses the raw response bytes in C, ~2-3x faster than
+    # stdlib json. json.loads also accepts bytes, so the fallback is drop-in.
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # ─── Constants ────────────────────────────────────────────────────────
 
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_DIR = SCRIPT_DIR.parent
 DB_PATH = PROJECT_DIR / "data" / "vocabulary.db"
+LA_CACHE_DIR = PROJECT_DIR / "data" / "linkedart-cache"
+LA_CACHE_TTL_S = 30 * 24 * 3600
 
 LINKED_ART_BASE = "https://data.rijksmuseum.nl"
 USER_AGENT = "rijksmuseum-mcp-harvest/1.0"
 BATCH_SIZE = 500
+COMMIT_EVERY = 10_000
+DEFAULT_CONCURRENCY = 16
+
+LA_HEADERS = {
+    "Accept": "application/ld+json",
+    "Profile": "https://linked.art/ns/v1/linked-art.json",
+    "User-Agent": USER_AGENT,
+}
 
 LANG_EN = "http://vocab.getty.edu/aat/300388277"
 LANG_NL = "http://vocab.getty.edu/aat/300388256"
+LANG_CODES = {LANG_EN: "en", LANG_NL: "nl"}
 
-# AAT name classification URIs → short labels
+# AAT name classification IDs (URI tail) → short labels
 AAT_CLASSIFICATION = {
     "300404670": "display",
     "300404671": "preferred",
@@ -57,21 +96,51 @@ CREATE TABLE IF NOT EXISTS person_names (
 CREATE INDEX IF NOT EXISTS idx_person_names_id ON person_names(person_id);
 """
 
+PERSON_NAMES_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE person_names_fts USING fts5(
+    name,
+    content='person_names', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+)
+"""
 
-def fetch_person_names(person_id: str) -> list[dict] | None:
-    """Fetch a person's Linked Art entity and extract all name variants."""
-    url = f"{LINKED_ART_BASE}/{person_id}"
-    req = urllib.request.Request(url, headers={
-        "Accept": "application/ld+json",
-        "Profile": "https://linked.art/ns/v1/linked-art.json",
-        "User-Agent": USER_AGENT,
-    })
-    try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read())
-    except Exception:
-        return None
 
+def ensure_person_names_fts(conn: sqlite3.Connection) -> None:
+    """Create or re-sync person_names_fts, then index new rows as they are inserted.
+
+    The index is rebuilt up front when it is missing or out of step with
+    person_names — e.g. after harvest-vocabulary-db.py added rows since its
+    last Phase 3 build. person_names is insert-only, so comparing the row
+    count with the index's document count (the _docsize shadow table, which
+    unlike COUNT(*) on the FTS table doesn't read content back) is enough to
+    detect that. After that a TEMP trigger mirrors each row INSERT OR IGNORE
+    actually adds, so no end-of-run 'rebuild' scan is needed. TEMP keeps the
+    trigger out of the shipped DB, where harvest-vocabulary-db.py drops and
+    rebuilds the index.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'person_names_fts'"
+    ).fetchone()
+    if not exists:
+        conn.execute(PERSON_NAMES_FTS_SCHEMA)
+        stale = True
+    else:
+        indexed = conn.execute("SELECT COUNT(*) FROM person_names_fts_docsize").fetchone()[0]
+        rows = conn.execute("SELECT COUNT(*) FROM person_names").fetchone()[0]
+        stale = indexed != rows
+    if stale:
+        conn.execute("INSERT INTO person_names_fts(person_names_fts) VALUES('rebuild')")
+    conn.execute("""
+        CREATE TEMP TRIGGER IF NOT EXISTS person_names_fts_ai
+        AFTER INSERT ON main.person_names BEGIN
+            INSERT INTO person_names_fts(rowid, name) VALUES (new.rowid, new.name);
+        END
+    """)
+    conn.commit()
+
+
+def extract_name_variants(person_id: str, data: dict) -> list[tuple]:
+    """Extract (person_id, name, lang, classification) rows from a Linked Art person."""
     seen = set()  # deduplicate (name, lang) pairs
     variants = []
 
@@ -84,60 +153,247 @@ def fetch_person_names(person_id: str) -> list[dict] | None:
             continue
 
         # Determine language
-        lang = None
-        for l in entry.get("language", []):
-            lid = l.get("id", "")
-            if lid == LANG_EN:
-                lang = "en"
-                break
-            elif lid == LANG_NL:
-                lang = "nl"
-                break
+        lang = next((LANG_CODES[lid] for l in entry.get("language", [])
+                     if (lid := l.get("id")) in LANG_CODES), None)
 
         # Determine classification from classified_as AAT URIs.
         # Linked Art occasionally returns bare-string classified_as entries instead of dicts (~7%
         # rate per #231); skip those defensively rather than crashing on .get().
-        classification = None
-        for c in entry.get("classified_as", []):
-            if not isinstance(c, dict):
-                continue
-            cid = c.get("id", "")
-            for suffix, label in AAT_CLASSIFICATION.items():
-                if cid.endswith(suffix):
-                    classification = label
-                    break
-            if classification:
-                break
+        classification = next((
+            label for c in entry.get("classified_as", [])
+            if isinstance(c, dict)
+            and (label := AAT_CLASSIFICATION.get(c.get("id", "").rpartition("/")[2]))
+        ), None)
 
         key = (content, lang)
         if key not in seen:
             seen.add(key)
-            variants.append({
-                "person_id": person_id,
-                "name": content,
-                "lang": lang,
-                "classification": classification,
-            })
+            variants.append((person_id, content, lang, classification))
 
     return variants
 
 
+# ─── Response cache ───────────────────────────────────────────────────
+
+def read_cached_entity(cache_dir: Path | None, person_id: str) -> dict | None:
+    """Return the cached Linked Art JSON for ``person_id`` if fresh, else None."""
+    if cache_dir is None:
+        return None
+    path = cache_dir / f"{person_id}.json.gz"
+    try:
+        if time.time() - path.stat().st_mtime > LA_CACHE_TTL_S:
+            return None
+        with gzip.open(path, "rb") as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def write_cached_entity(cache_dir: Path | None, person_id: str, body: bytes) -> None:
+    """Atomically store a raw Linked Art response (tmp file + os.replace)."""
+    if cache_dir is None:
+        return
+    path = cache_dir / f"{person_id}.json.gz"
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(gzip.compress(body))
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+# ─── Fetching ─────────────────────────────────────────────────────────
+
+def fetch_person_names(person_id: str,
+                       cache_dir: Path | None = None,
+                       read_cache: bool = True) -> list[tuple] | None:
+    """Fetch a person's Linked Art entity and extract all name variants.
+
+    With ``read_cache=False`` the cache is not consulted, but the fresh
+    response is still written to ``cache_dir``.
+    """
+    data = read_cached_entity(cache_dir, person_id) if read_cache else None
+    if data is None:
+        url = f"{LINKED_ART_BASE}/{person_id}"
+        req = urllib.request.Request(url, headers=LA_HEADERS)
+        try:
+            with urllib.request.urlopen(req, timeout=15) as resp:
+                body = resp.read()
+            data = json_loads(body)
+        except Exception:
+            return None
+        write_cached_entity(cache_dir, person_id, body)
+    return extract_name_variants(person_id, data)
+
+
+async def fetch_person_names_async(session, semaphore: asyncio.Semaphore,
+                                   person_id: str,
+                                   cache_dir: Path | None = None,
+                                   max_retries: int = 4,
+                                   read_cache: bool = True) -> list[tuple] | None:
+    """aiohttp counterpart of ``fetch_person_names``.
+
+    Retries 429/5xx and transport errors with exponential backoff; any other
+    non-200 status (e.g. 404 for a withdrawn person) returns None.
+    """
+    import aiohttp
+
+    data = read_cached_entity(cache_dir, person_id) if read_cache else None
+    if data is not None:
+        return extract_name_variants(person_id, data)
+
+    url = f"{LINKED_ART_BASE}/{person_id}"
+    async with semaphore:
+        for attempt in range(max_retries + 1):
+            try:
+                async with session.get(url) as resp:
+                    if resp.status == 429 or resp.status >= 500:
+                        await asyncio.sleep(min(2 ** attempt, 30))
+                        continue
+                    if resp.status != 200:
+                        return None
+                    body = await resp.read()
+                data = json_loads(body)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                if attempt < max_retries:
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                return None
+            write_cached_entity(cache_dir, person_id, body)
+            return extract_name_variants(person_id, data)
+    return None
+
+
+def _client_session(concurrency: int):
+    import aiohttp
+
+    return aiohttp.ClientSession(
+        headers=LA_HEADERS,
+        connector=aiohttp.TCPConnector(limit_per_host=concurrency),
+        timeout=aiohttp.ClientTimeout(total=15),
+    )
+
+
+async def _harvest_async(chunks: list[list[str]], concurrency: int,
+                         handle_chunk, cache_dir: Path | None,
+                         read_cache: bool = True) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    done = 0
+    async with _client_session(concurrency) as session:
+        for chunk in chunks:
+            results = await asyncio.gather(*(
+                fetch_person_names_async(session, semaphore, pid, cache_dir,
+                                         read_cache=read_cache)
+                for pid in chunk
+            ))
+            done += len(chunk)
+            handle_chunk(done, results)
+
+
+async def _fetch_chunk_async(chunk: list[str], concurrency: int,
+                             cache_dir: Path | None,
+                             read_cache: bool = True) -> list:
+    semaphore = asyncio.Semaphore(concurrency)
+    async with _client_session(concurrency) as session:
+        return await asyncio.gather(*(
+            fetch_person_names_async(session, semaphore, pid, cache_dir,
+                                     read_cache=read_cache)
+            for pid in chunk
+        ))
+
+
+def fetch_chunk(chunk: list[str], concurrency: int,
+                cache_dir: Path | None, read_cache: bool = True) -> list:
+    """Fetch one chunk of persons; the unit of work for --workers > 1."""
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        return [fetch_person_names(p, cache_dir, read_cache) for p in chunk]
+    return asyncio.run(_fetch_chunk_async(chunk, concurrency, cache_dir,
+                                          read_cache))
+
+
+def harvest(persons: list[str], concurrency: int, handle_chunk,
+            cache_dir: Path | None = None, workers: int = 1,
+            read_cache: bool = True) -> None:
+    """Fetch name variants for ``persons`` in BATCH_SIZE chunks.
+
+    ``handle_chunk(done, results)`` is called on the calling thread after
+    each chunk, with ``results`` aligned to that chunk of ``persons``.
+
+    With ``workers > 1`` chunks are fetched and parsed by a process pool
+    (each worker runs its own session, so up to ``workers * concurrency``
+    requests are in flight); results still come back in order to the
+    caller, which stays the only SQLite writer.
+
+    ``read_cache=False`` bypasses cached responses (every person is fetched
+    from Linked Art) while still refreshing the cache with what comes back.
+    """
+    chunks = [persons[i:i + BATCH_SIZE] for i in range(0, len(persons), BATCH_SIZE)]
+    try:
+        import aiohttp  # noqa: F401
+        have_aiohttp = True
+    except ImportError:
+        have_aiohttp = False
+        print("  aiohttp not installed — falling back to sequential fetches",
+              file=sys.stderr)
+
+    if workers > 1:
+        fetch = functools.partial(fetch_chunk, concurrency=concurrency,
+                                  cache_dir=cache_dir, read_cache=read_cache)
+        done = 0
+        with multiprocessing.Pool(workers) as pool:
+            for chunk, results in zip(chunks, pool.imap(fetch, chunks)):
+                done += len(chunk)
+                handle_chunk(done, results)
+    elif have_aiohttp:
+        asyncio.run(_harvest_async(chunks, concurrency, handle_chunk, cache_dir,
+                                   read_cache))
+    else:
+        done = 0
+        for chunk in chunks:
+            done += len(chunk)
+            handle_chunk(done, [fetch_person_names(p, cache_dir, read_cache)
+                                for p in chunk])
+
+
 def main():
     parser = argparse.ArgumentParser(description="Targeted refetch of Linked Art person name variants")
     parser.add_argument("--db", type=str, default=str(DB_PATH), help="Path to vocabulary.db")
     parser.add_argument(
         "--refetch-all",
         action="store_true",
-        help="Re-fetch every person (default skips persons already in person_names). Writes use INSERT OR IGNORE.",
+        help="Re-fetch every person from Linked Art, ignoring cached responses (default skips persons "
+             "already in person_names). Fresh responses still refresh the cache. Writes use INSERT OR IGNORE.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Max in-flight Linked Art requests when aiohttp is available (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for fetching/parsing; each gets its own --concurrency budget (default: 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Neither read nor write cached Linked Art responses under {LA_CACHE_DIR}",
     )
     args = parser.parse_args()
 
     conn = sqlite3.connect(args.db)
     conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
 
     # Create schema
     conn.executescript(PERSON_NAMES_SCHEMA)
     conn.commit()
+    ensure_person_names_fts(conn)
 
     # Get person IDs from vocabulary
     all_persons = [r[0] for r in conn.execute(
@@ -159,71 +415,60 @@ def main():
         print("Nothing to do.")
         return
 
+    cache_dir = None if args.no_cache else LA_CACHE_DIR
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
     t0 = time.time()
     fetched = 0
     failed = 0
     total_names = 0
-    batch = []
 
-    for i, person_id in enumerate(persons, 1):
-        variants = fetch_person_names(person_id)
-        if variants is not None:
+    def handle_chunk(done: int, results: list[list[tuple] | None]) -> None:
+        nonlocal fetched, failed, total_names
+        batch = []
+        for variants in results:
+            if variants is None:
+                failed += 1
+                continue
             batch.extend(variants)
             total_names += len(variants)
             fetched += 1
-        else:
-            failed += 1
-
-        if i % BATCH_SIZE == 0:
-            if batch:
-                conn.executemany(
-                    "INSERT OR IGNORE INTO person_names (person_id, name, lang, classification) "
-                    "VALUES (:person_id, :name, :lang, :classification)",
-                    batch,
-                )
-                conn.commit()
-                batch = []
-
-        if i % 1000 == 0:
+        if batch:
+            conn.executemany(
+                "INSERT OR IGNORE INTO person_names (person_id, name, lang, classification) "
+                "VALUES (?, ?, ?, ?)",
+                batch,
+            )
+        if done % COMMIT_EVERY == 0:
+            conn.commit()
+
+        if done % 1000 == 0 or done == len(persons):
             elapsed = time.time() - t0
-            rate = i / elapsed
-            remaining = (len(persons) - i) / rate
+            rate = done / elapsed
+            remaining = (len(persons) - done) / rate
             print(
-                f"  {i:,}/{len(persons):,} ({fetched:,} ok, {failed:,} failed, "
+                f"  {done:,}/{len(persons):,} ({fetched:,} ok, {failed:,} failed, "
                 f"{total_names:,} names, {rate:.0f}/s, ~{remaining:.0f}s left)",
                 flush=True,
             )
 
-    # Flush remaining batch
-    if batch:
-        conn.executemany(
-            "INSERT OR IGNORE INTO person_names (person_id, name, lang, classification) "
-            "VALUES (:person_id, :name, :lang, :classification)",
-            batch,
-        )
+    try:
+        harvest(persons, args.concurrency, handle_chunk, cache_dir, args.workers,
+                read_cache=not args.refetch_all)
+    finally:
+        # Keep whatever was fetched before an interrupt; reruns skip it.
         conn.commit()
 
     elapsed = time.time() - t0
     print(f"\nHarvest complete: {fetched:,} persons, {failed:,} failed, {total_names:,} names, {elapsed:.0f}s")
 
-    # Build FTS5 index
-    print("Building person_names_fts index...")
-    conn.execute("DROP TABLE IF EXISTS person_names_fts")
-    conn.execute("""
-        CREATE VIRTUAL TABLE person_names_fts USING fts5(
-            name,
-            content='person_names', content_rowid='rowid',
-            tokenize='unicode61 remove_diacritics 2'
-        )
-    """)
-    conn.execute("INSERT INTO person_names_fts(person_names_fts) VALUES('rebuild')")
-    fts_count = conn.execute("SELECT COUNT(*) FROM person_names_fts").fetchone()[0]
-    print(f"  person_names_fts: {fts_count:,} rows")
-    conn.commit()
-
-    # Final stats
+    # Final stats. person_names_fts is external-content and kept in step by
+    # the trigger, so its row count is the content table's; COUNT(*) on the
+    # FTS table itself would read every row back through FTS5.
     distinct_persons = conn.execute("SELECT COUNT(DISTINCT person_id) FROM person_names").fetchone()[0]
     total_rows = conn.execute("SELECT COUNT(*) FROM person_names").fetchone()[0]
+    print(f"  person_names_fts: {total_rows:,} rows")
     avg_names = total_rows / distinct_persons if distinct_persons else 0
     print(f"\nFinal: {total_rows:,} name rows for {distinct_persons:,} persons ({avg_names:.1f} names/person avg)")
 
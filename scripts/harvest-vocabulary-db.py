@@ -31,11 +31,13 @@ Output: data/vocabulary.db (~1 GB)
 
 import argparse
 import csv
+import functools
 import hashlib
 import html
 import json
 import math
 import os
+import queue
 import re
 import socket
 import sqlite3
@@ -44,6 +46,7 @@ import zipfile
 from collections import Counter, defaultdict
 import sys
 import tarfile
+import threading
 from itertools import chain
 import time
 import urllib.error
@@ -52,10 +55,20 @@ import urllib.request
 import requests
 import requests.adapters
 import xml.etree.ElementTree as ET
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait,
+)
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    # Optional: orjson parses the raw response bytes in C, ~2-3x faster than
+    # stdlib json on large Linked Art documents. json.loads also accepts
+    # bytes, so the fallback is drop-in.
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # Force line-buffered stdout/stderr so progress prints appear in `tee` output
 # immediately, regardless of how the interpreter was invoked. See CLAUDE.md
 # "Python stdout buffering when piped to `tee`" — caused an hour of "is it
@@ -164,15 +177,35 @@ OAI_BASE = "https://data.rijksmuseum.nl/oai"
 LINKED_ART_BASE = "https://data.rijksmuseum.nl"
 USER_AGENT = "rijksmuseum-mcp-harvest/1.0"
 DEFAULT_THREADS = 12
-BATCH_SIZE = 500  # Commit every N pages
+# Phase 1 commits when either limit is hit, so a transaction stays well inside
+# the page cache on record-heavy pages and quiet stretches still commit.
+PHASE1_COMMIT_ROWS = 50_000
+PHASE1_COMMIT_SECONDS = 30
+# Phase 2/4 progress lines are printed on a clock rather than every N results,
+# so slow stretches (rate limiting, long-tail fetches) still show up.
+PROGRESS_INTERVAL_S = 10.0
 
 # Module-level HTTP session with a connection pool shared across threads.
 # Amortises TCP+TLS handshake cost (~90 ms/request) across the Phase 4 worker
 # pool — the previous urllib.request-based path opened a fresh connection for
 # every artwork, pinning ~9 cores on TLS crypto and capping throughput at ~5/s.
 # Pool sized for 32 concurrent workers (generous headroom over DEFAULT_THREADS).
-# Callers handle their own retries (_resolve_one, resolve_artwork have distinct
-# error-categorisation semantics), so max_retries=0 on the adapter.
+# Callers handle connection errors and timeouts themselves (_resolve_one,
+# resolve_artwork have distinct error-categorisation semantics), so the adapter
+# only retries transient 5xx statuses with a short, capped backoff, and hands
+# back the last response once those retries run out, letting callers classify
+# it exactly as before. 429 is deliberately not retried here and Retry-After
+# is ignored: an unbounded server-chosen sleep would pin a resolver thread
+# inside session.get(), whereas the callers' own failure tracking already
+# schedules rate-limited URIs for a later retry.
+_HTTP_RETRY = requests.adapters.Retry(
+    total=2, connect=0, read=0, other=0, status=2,
+    backoff_factor=0.5,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
 _HTTP_SESSION: requests.Session | None = None
 
 
@@ -183,13 +216,66 @@ def get_http_session() -> requests.Session:
         adapter = requests.adapters.HTTPAdapter(
             pool_connections=32,
             pool_maxsize=32,
-            max_retries=0,
+            max_retries=_HTTP_RETRY,
         )
         s.mount("https://", adapter)
         s.mount("http://", adapter)
         _HTTP_SESSION = s
     return _HTTP_SESSION
 
+
+def iter_completed(pool, fn, items, window: int, arg=None):
+    """Run ``fn`` over ``items`` on ``pool``, yielding ``(item, future)`` as
+    each call finishes.
+
+    At most ``window`` calls are in flight: a new item is submitted as soon
+    as any earlier one completes, so one slow request never idles the pool
+    the way per-batch ``as_completed`` does at each batch tail, and futures
+    for the whole work list are never materialised at once. ``arg(item)``
+    (default: the item itself) is what gets passed to ``fn``.
+    """
+    in_flight: dict = {}
+    for item in items:
+        if len(in_flight) >= window:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield in_flight.pop(future), future
+        in_flight[pool.submit(fn, arg(item) if arg else item)] = item
+    for future in as_completed(in_flight):
+        yield in_flight[future], future
+
+
+def iter_in_background(items, maxsize: int):
+    """Drive the iterator ``items`` on a daemon thread, yielding its values
+    through a bounded queue.
+
+    Wrapping ``iter_completed`` in this keeps the pool fed (new submissions as
+    calls finish) while the consumer is busy writing to SQLite; the queue
+    bound is the backpressure. An exception raised by ``items`` is re-raised
+    in the consumer.
+    """
+    results: queue.Queue = queue.Queue(maxsize=maxsize)
+    done = object()
+
+    def produce():
+        try:
+            for item in items:
+                results.put((item, None))
+        except BaseException as e:
+            results.put((done, e))
+            return
+        results.put((done, None))
+
+    threading.Thread(target=produce, daemon=True).start()
+    while True:
+        item, exc = results.get()
+        if exc is not None:
+            raise exc
+        if item is done:
+            return
+        yield item
+
+
 # ─── AAT URIs for Tier 2 Linked Art parsing ─────────────────────────
 
 AAT_INSCRIPTIONS = "http://vocab.getty.edu/aat/300435414"
@@ -219,6 +305,10 @@ DIAMETER_URIS = {AAT_DIAMETER, RM_DIAMETER}
 AAT_UNIT_G = "http://vocab.getty.edu/aat/300379225"     # grams
 AAT_UNIT_KG = "http://vocab.getty.edu/aat/300379226"    # kilograms
 
+# referred_to_by statement types extracted in resolve_artwork(), in the order
+# its (inscription, provenance, credit line, description) fields unpack them.
+STATEMENT_TYPES = (AAT_INSCRIPTIONS, AAT_PROVENANCE, AAT_CREDIT_LINE, AAT_DESCRIPTION)
+
 # Source object types (used_object_of_type) — AAT concepts for the type of object
 # used as a source in production (e.g., "this print was made after a painting").
 # Only 6 distinct values across the collection; all are external AAT URIs not in the
@@ -281,6 +371,17 @@ NT_LANG_PATTERN = re.compile(
     r'^<([^>]+)>\s+<([^>]+)>\s+"(' + _LITERAL_BODY + r')"@([A-Za-z][A-Za-z0-9-]*)\s*\.\s*$'
 )
 
+# Single-pass form of the three patterns above for parse_nt_file's hot loop:
+# one match per line instead of up to three. Groups: (s_uri, s_bnode, pred,
+# o_uri, o_literal, lang); o_literal may carry a ^^datatype (dropped) or an
+# @lang tag, never both. Bnode subjects with an @lang literal match here but
+# not BNODE_PATTERN, so callers must skip that combination.
+NT_TRIPLE_PATTERN = re.compile(
+    r'^(?:<([^>]+)>|_:(\S+))\s+<([^>]+)>\s+'
+    r'(?:<([^>]+)>|"(' + _LITERAL_BODY + r')"(?:\^\^<[^>]+>|@([A-Za-z][A-Za-z0-9-]*))?)'
+    r'\s*\.\s*$'
+)
+
 
 # N-Triples literal escape sequences: \" → ", \\ → \, \n → newline, etc.
 # https://www.w3.org/TR/n-triples/#grammar-production-ECHAR
@@ -324,7 +425,7 @@ AAT_DISPLAY_NAME = AAT_TITLE_DISPLAY  # same AAT concept (300404670)
 AAT_PREFERRED_NAME = "http://vocab.getty.edu/aat/300404671"
 AAT_INVERTED_NAME = "http://vocab.getty.edu/aat/300404672"
 
-# AAT name classification URI suffix → label (for person_names table)
+# AAT name classification URI tail (last path segment) → label (for person_names table)
 AAT_NAME_CLASSIFICATION = {
     "300404670": "display",
     "300404671": "preferred",
@@ -490,6 +591,33 @@ RDF_RESOURCE = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource"
 RDF_ABOUT = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about"
 OWL_SAME_AS = f"{{{NS['owl']}}}sameAs"
 XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+OAI_RECORD = f"{{{NS['oai']}}}record"
+OAI_RESUMPTION_TOKEN = f"{{{NS['oai']}}}resumptionToken"
+
+# Clark-notation tags read by extract_record, resolved once here rather than
+# via prefix paths per record.
+OAI_HEADER = f"{{{NS['oai']}}}header"
+OAI_SET_SPEC = f"{{{NS['oai']}}}setSpec"
+OAI_METADATA = f"{{{NS['oai']}}}metadata"
+EDM_PROVIDED_CHO = f"{{{NS['edm']}}}ProvidedCHO"
+EDM_AGENT = f"{{{NS['edm']}}}Agent"
+EDM_RIGHTS = f"{{{NS['edm']}}}rights"
+EDM_IS_SHOWN_BY = f"{{{NS['edm']}}}isShownBy"
+EDM_OBJECT = f"{{{NS['edm']}}}object"
+ORE_AGGREGATION = f"{{{NS['ore']}}}Aggregation"
+DC_IDENTIFIER = f"{{{NS['dc']}}}identifier"
+DC_TITLE = f"{{{NS['dc']}}}title"
+DCTERMS_EXTENT = f"{{{NS['dcterms']}}}extent"
+SKOS_PREF_LABEL = f"{{{NS['skos']}}}prefLabel"
+RDA_PLACE_OF_BIRTH = f"{{{NS['rdaGr2']}}}placeOfBirth"
+RDA_PLACE_OF_DEATH = f"{{{NS['rdaGr2']}}}placeOfDeath"
+RDA_PROFESSION = f"{{{NS['rdaGr2']}}}professionOrOccupation"
+# Entity definitions at the metadata root whose owl:sameAs carry external IDs.
+SAME_AS_ENTITY_TAGS = (
+    f"{{{NS['skos']}}}Concept",
+    f"{{{NS['edm']}}}Place",
+    f"{{{NS['rdf']}}}Description",
+)
 
 # Regex to extract IIIF identifier from iiif.micr.io URLs
 IIIF_ID_RE = re.compile(r"https?://iiif\.micr\.io/([^/]+)")
@@ -779,13 +907,12 @@ VEI_INSERT_SQL = (
 
 # Mappings INSERT shape diverges between text-schema (pre-Phase 3) and
 # integer-schema (post-Phase 3 finalization). Phase 4 and Phase 4.5 both
-# insert into mappings during the harvest, so they share this helper.
-_MAPPING_INSERT_SQL_INT = """
-    INSERT OR IGNORE INTO mappings (artwork_id, vocab_rowid, field_id)
-    SELECT a.art_id, v.vocab_int_id, f.id
-    FROM artworks a, vocabulary v, field_lookup f
-    WHERE a.object_number = ? AND v.id = ? AND f.name = ?
-"""
+# insert into mappings during the harvest, so they share these helpers:
+# callers build text (object_number, vocab_id, field) rows and pass them
+# through the encoder from _mapping_row_encoder() before executemany.
+_MAPPING_INSERT_SQL_INT = (
+    "INSERT OR IGNORE INTO mappings (artwork_id, vocab_rowid, field_id) VALUES (?, ?, ?)"
+)
 
 _MAPPING_INSERT_SQL_TEXT = (
     "INSERT OR IGNORE INTO mappings (object_number, vocab_id, field) VALUES (?, ?, ?)"
@@ -796,6 +923,34 @@ def _mapping_insert_sql(int_schema: bool) -> str:
     return _MAPPING_INSERT_SQL_INT if int_schema else _MAPPING_INSERT_SQL_TEXT
 
 
+def _mapping_row_encoder(conn: sqlite3.Connection, int_schema: bool):
+    """Return a function that turns text mapping rows into rows for
+    ``_mapping_insert_sql(int_schema)``.
+
+    Text schema: rows pass through unchanged. Integer schema: art_id,
+    vocab_int_id and field_lookup.id are loaded into dicts once, so each row
+    is three dict lookups instead of a three-table join per INSERT. Rows
+    with an unknown object, vocab ID or field are dropped, as the join did.
+    """
+    if not int_schema:
+        return list
+    art_ids = dict(conn.execute("SELECT object_number, art_id FROM artworks"))
+    vocab_ids = dict(conn.execute("SELECT id, vocab_int_id FROM vocabulary"))
+    field_ids = dict(conn.execute("SELECT name, id FROM field_lookup"))
+
+    def encode(rows) -> list[tuple[int, int, int]]:
+        encoded = []
+        for object_number, vocab_id, field in rows:
+            art_id = art_ids.get(object_number)
+            vocab_rowid = vocab_ids.get(vocab_id)
+            field_id = field_ids.get(field)
+            if art_id is not None and vocab_rowid is not None and field_id is not None:
+                encoded.append((art_id, vocab_rowid, field_id))
+        return encoded
+
+    return encode
+
+
 def get_columns(conn: sqlite3.Connection, table: str) -> set[str]:
     """Return the set of column names for a given table."""
     return {row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
@@ -808,6 +963,92 @@ def table_exists(conn: sqlite3.Connection, name: str) -> bool:
     ).fetchone() is not None
 
 
+# Phases 0-4 are long, append-heavy and resumable (OAI checkpoint, tier2_done
+# flags), so they trade memory for throughput; Phase 3's rebuilds (integer
+# encoding, enrichment, FTS, stats) are re-runnable via --phase 5 and keep the
+# same settings up to the final VACUUM. synchronous stays NORMAL: in WAL mode
+# that only fsyncs at checkpoints (rare with the larger autocheckpoint), and
+# unlike OFF it survives an OS crash or power loss mid-harvest — at worst the
+# last few commits are lost and --resume / --phase picks up from there. The
+# crash-safe table swaps in Phase 3 rely on the same guarantee.
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-524288",   # 512 MB cache
+    "PRAGMA mmap_size=8589934592",  # 8 GB; SQLite clamps to its compiled maximum
+    "PRAGMA wal_autocheckpoint=10000",  # pages; fewer checkpoints mid-load
+)
+SAFE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=DEFAULT",
+    "PRAGMA cache_size=-64000",    # 64 MB cache
+    "PRAGMA mmap_size=0",
+    "PRAGMA wal_autocheckpoint=1000",  # SQLite default
+)
+
+# Phase 3's final VACUUM rewrites the whole file. A full build always clears
+# this bar (the text-schema mappings table is dropped); a --phase 5 re-run
+# over an already compacted DB usually frees far less and skips the rewrite.
+VACUUM_MIN_FREE_RATIO = 0.05
+
+
+def bulk_load_pragmas(conn: sqlite3.Connection) -> None:
+    """Switch to bulk-load settings for the harvest and Phase 3 rebuilds."""
+    conn.commit()  # synchronous can't change inside an open transaction
+    for pragma in BULK_LOAD_PRAGMAS:
+        conn.execute(pragma)
+
+
+def restore_safe_pragmas(conn: sqlite3.Connection) -> None:
+    """Restore the durable defaults from create_or_open_db() before VACUUM.
+
+    temp_store=MEMORY would otherwise put VACUUM's full temporary copy of
+    the database in RAM.
+    """
+    conn.commit()
+    for pragma in SAFE_PRAGMAS:
+        conn.execute(pragma)
+
+
+# Secondary indexes on the text-schema mappings table. Phase 1 only inserts
+# into mappings, so prepare_phase1_schema() drops them for the load and
+# finalize_phase1_schema() builds each once over the full table afterwards.
+# The PRIMARY KEY stays: INSERT OR IGNORE relies on it to dedup re-harvested
+# pages after --resume.
+TEXT_MAPPINGS_INDEXES = (
+    ("idx_mappings_field_vocab",
+     "CREATE INDEX IF NOT EXISTS idx_mappings_field_vocab  ON mappings(field, vocab_id)"),
+    ("idx_mappings_field_object",
+     "CREATE INDEX IF NOT EXISTS idx_mappings_field_object ON mappings(field, object_number)"),
+    ("idx_mappings_vocab",
+     "CREATE INDEX IF NOT EXISTS idx_mappings_vocab        ON mappings(vocab_id)"),
+)
+
+
+def prepare_phase1_schema(conn: sqlite3.Connection) -> None:
+    """Drop the text-schema mappings indexes before the Phase 1 bulk insert."""
+    if "vocab_id" not in get_columns(conn, "mappings"):
+        return
+    for name, _create_sql in TEXT_MAPPINGS_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    conn.commit()
+
+
+def finalize_phase1_schema(conn: sqlite3.Connection) -> None:
+    """Rebuild the mappings indexes dropped by prepare_phase1_schema().
+
+    create_or_open_db() also re-creates them, so an interrupted Phase 1
+    is healed on the next run.
+    """
+    if "vocab_id" not in get_columns(conn, "mappings"):
+        return
+    t0 = time.time()
+    for _name, create_sql in TEXT_MAPPINGS_INDEXES:
+        conn.execute(create_sql)
+    conn.commit()
+    print(f"  Rebuilt mappings indexes in {time.time() - t0:.1f}s")
+
+
 def create_or_open_db() -> sqlite3.Connection:
     """Create or open the SQLite database, migrating schema if needed."""
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -831,9 +1072,8 @@ def create_or_open_db() -> sqlite3.Connection:
         conn.execute("DROP INDEX IF EXISTS idx_mappings_field_object")
     else:
         # Text schema — original indexes for Phase 1/2/4 queries
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_mappings_field_vocab  ON mappings(field, vocab_id)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_mappings_field_object ON mappings(field, object_number)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_mappings_vocab        ON mappings(vocab_id)")
+        for _name, create_sql in TEXT_MAPPINGS_INDEXES:
+            conn.execute(create_sql)
 
     # Migrate existing DBs: add normalized label columns if missing
     vocab_cols = get_columns(conn, "vocabulary")
@@ -964,6 +1204,32 @@ def make_iconclass_resolver(db_path: str | None = None):
     return resolve
 
 
+_WKT_NUMBER_CHARS = "-.0123456789"
+
+
+def parse_wkt_point(wkt: str) -> tuple[float | None, float | None]:
+    """Parse a ``POINT(lon lat)`` WKT literal into ``(lon, lat)``.
+
+    Plain string slicing instead of a regex: the dumps only ever carry this
+    one fixed shape. Anything else (other geometries, stray whitespace,
+    non-numeric or malformed numbers) yields ``(None, None)``.
+    """
+    if not wkt.startswith("POINT("):
+        return None, None
+    close = wkt.find(")", 6)
+    if close < 0:
+        return None, None
+    inner = wkt[6:close]
+    parts = inner.split()
+    if (len(parts) != 2 or not inner.startswith(parts[0]) or not inner.endswith(parts[1])
+            or parts[0].strip(_WKT_NUMBER_CHARS) or parts[1].strip(_WKT_NUMBER_CHARS)):
+        return None, None
+    try:
+        return float(parts[0]), float(parts[1])
+    except ValueError:
+        return None, None
+
+
 def parse_nt_file(filepath: str, default_type: str, iconclass_resolver=None,
                   parse_stats: Counter | None = None) -> dict | None:
     """Parse a single N-Triples entity file into a vocabulary record.
@@ -1012,8 +1278,14 @@ def parse_nt_file(filepath: str, default_type: str, iconclass_resolver=None,
     schema_alt_names_by_lang: dict[str, str] = {}
     schema_same_as: list[str] = []
 
+    # Stream lines straight off the file object (no readlines() list). Read
+    # or decode failures anywhere in the file still drop the whole entity.
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
+        f = open(filepath, "r", encoding="utf-8", buffering=65536)
+    except Exception:
+        return None
+    with f:
+        try:
             # #317: upstream dump-build occasionally saves an HTML error page (e.g.
             # a 404) under a .nt filename. It is not RDF — count it as a distinct
             # failure category instead of letting it pass as a silent zero-triple
@@ -1025,92 +1297,91 @@ def parse_nt_file(filepath: str, default_type: str, iconclass_resolver=None,
                     parse_stats["html_error"] += 1
                 return None
             f.seek(0)
-            lines = f.readlines()
-    except Exception:
-        return None
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
+            match_triple = NT_TRIPLE_PATTERN.match
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
 
-        m = NT_PATTERN.match(line)
-        if m and m.group(1) == entity_uri:
-            pred = m.group(2)
-            obj_uri = m.group(3)
-            obj_lit = _unescape_nt_literal(m.group(4)) if m.group(4) is not None else None
-            if pred == P_EQUIVALENT and obj_uri:
-                equivalents.append(obj_uri)
-            elif pred == P_BROADER and obj_uri:
-                broader_id = obj_uri.split("/")[-1]
-            elif pred == "http://www.cidoc-crm.org/cidoc-crm/P168_place_is_defined_by" and obj_lit:
-                defined_by = obj_lit
-            elif pred == RDF_TYPE and obj_uri:
-                rdf_type = obj_uri
-                if obj_uri in SCHEMA_TYPE_MAP:
-                    schema_types.add(obj_uri)
-            # Schema.org: bare-literal variants (no language tag) match NT_PATTERN's
-            # literal branch because there's no `@lang` suffix. Person/Organization
-            # names come through here. Topical_term / place labels are language-tagged
-            # and go through NT_LANG_PATTERN below instead.
-            elif pred == P_SCHEMA_NAME and obj_lit is not None:
-                schema_names_bare.append(obj_lit)
-            elif pred == P_SCHEMA_ALTERNATE_NAME and obj_lit is not None:
-                schema_alt_names_bare.append(obj_lit)
-            elif pred == P_SCHEMA_SAME_AS and obj_uri:
-                schema_same_as.append(obj_uri)
-            elif pred in (SKOS_PREFLABEL, RDFS_LABEL) and obj_lit is not None:
-                # #245 fallback: untagged rdfs:label / skos:prefLabel literal
-                # (no `@lang` suffix). NT_LANG_PATTERN doesn't match these,
-                # so without this branch they'd be silently dropped.
-                if skos_label_untagged is None:
-                    skos_label_untagged = obj_lit
-
-        m = BNODE_PATTERN.match(line)
-        if m:
-            bnode_id = m.group(1)
-            pred = m.group(2)
-            obj_uri = m.group(3)
-            obj_lit = _unescape_nt_literal(m.group(4)) if m.group(4) is not None else None
-
-            if bnode_id not in bnodes:
-                bnodes[bnode_id] = {}
-
-            if pred == P_LABEL and obj_lit is not None:
-                bnodes[bnode_id]["label"] = obj_lit
-            elif pred == P_LANGUAGE and obj_uri:
-                bnodes[bnode_id]["language"] = obj_uri
-            elif pred == P_HAS_TYPE and obj_uri == AAT_DISPLAY_NAME:
-                bnodes[bnode_id]["is_display_name"] = True
-            elif pred == "http://www.w3.org/1999/02/22-rdf-syntax-ns#type":
-                if obj_uri == "http://www.cidoc-crm.org/cidoc-crm/E42_Identifier":
-                    bnodes[bnode_id]["is_identifier"] = True
-
-        # Match language-tagged literals (skos:prefLabel, rdfs:label, schema:name)
-        m = NT_LANG_PATTERN.match(line)
-        if m and m.group(1) == entity_uri:
-            pred = m.group(2)
-            text = _unescape_nt_literal(m.group(3))
-            lang_tag = m.group(4)
-            if pred in (SKOS_PREFLABEL, RDFS_LABEL) and text:
-                if lang_tag == "en" and not skos_label_en:
-                    skos_label_en = text
-                elif lang_tag == "nl" and not skos_label_nl:
-                    skos_label_nl = text
-                elif skos_label_other is None:
-                    # #245 fallback: capture first non-en/non-nl tag as a
-                    # last resort. lang_tag is always present here because
-                    # NT_LANG_PATTERN requires the @lang suffix.
-                    skos_label_other = text
-            elif pred == P_SCHEMA_NAME and text:
-                # BCP 47 primary subtag (e.g. `nl-NL` → `nl`, `zh-Hans-CN` → `zh`)
-                primary = lang_tag.split("-", 1)[0].lower()
-                if primary not in schema_names_by_lang:
-                    schema_names_by_lang[primary] = text
-            elif pred == P_SCHEMA_ALTERNATE_NAME and text:
-                primary = lang_tag.split("-", 1)[0].lower()
-                if primary not in schema_alt_names_by_lang:
-                    schema_alt_names_by_lang[primary] = text
+                m = match_triple(line)
+                if m is None:
+                    continue
+                subj_uri, bnode_id, pred, obj_uri, obj_raw, lang_tag = m.groups()
+
+                if bnode_id is not None:
+                    if lang_tag is not None:
+                        continue  # BNODE_PATTERN never accepted language-tagged literals
+                    obj_lit = _unescape_nt_literal(obj_raw) if obj_raw is not None else None
+
+                    if bnode_id not in bnodes:
+                        bnodes[bnode_id] = {}
+
+                    if pred == P_LABEL and obj_lit is not None:
+                        bnodes[bnode_id]["label"] = obj_lit
+                    elif pred == P_LANGUAGE and obj_uri:
+                        bnodes[bnode_id]["language"] = obj_uri
+                    elif pred == P_HAS_TYPE and obj_uri == AAT_DISPLAY_NAME:
+                        bnodes[bnode_id]["is_display_name"] = True
+                    elif pred == "http://www.w3.org/1999/02/22-rdf-syntax-ns#type":
+                        if obj_uri == "http://www.cidoc-crm.org/cidoc-crm/E42_Identifier":
+                            bnodes[bnode_id]["is_identifier"] = True
+
+                elif subj_uri != entity_uri:
+                    continue
+
+                elif lang_tag is None:
+                    obj_lit = _unescape_nt_literal(obj_raw) if obj_raw is not None else None
+                    if pred == P_EQUIVALENT and obj_uri:
+                        equivalents.append(obj_uri)
+                    elif pred == P_BROADER and obj_uri:
+                        broader_id = obj_uri.split("/")[-1]
+                    elif pred == "http://www.cidoc-crm.org/cidoc-crm/P168_place_is_defined_by" and obj_lit:
+                        defined_by = obj_lit
+                    elif pred == RDF_TYPE and obj_uri:
+                        rdf_type = obj_uri
+                        if obj_uri in SCHEMA_TYPE_MAP:
+                            schema_types.add(obj_uri)
+                    # Schema.org: bare-literal variants (no language tag) take this
+                    # branch. Person/Organization names come through here.
+                    # Topical_term / place labels are language-tagged and go through
+                    # the lang_tag branch below instead.
+                    elif pred == P_SCHEMA_NAME and obj_lit is not None:
+                        schema_names_bare.append(obj_lit)
+                    elif pred == P_SCHEMA_ALTERNATE_NAME and obj_lit is not None:
+                        schema_alt_names_bare.append(obj_lit)
+                    elif pred == P_SCHEMA_SAME_AS and obj_uri:
+                        schema_same_as.append(obj_uri)
+                    elif pred in (SKOS_PREFLABEL, RDFS_LABEL) and obj_lit is not None:
+                        # #245 fallback: untagged rdfs:label / skos:prefLabel literal
+                        # (no `@lang` suffix). The lang_tag branch doesn't see these,
+                        # so without this branch they'd be silently dropped.
+                        if skos_label_untagged is None:
+                            skos_label_untagged = obj_lit
+
+                else:
+                    # Language-tagged literals (skos:prefLabel, rdfs:label, schema:name)
+                    text = _unescape_nt_literal(obj_raw)
+                    if pred in (SKOS_PREFLABEL, RDFS_LABEL) and text:
+                        if lang_tag == "en" and not skos_label_en:
+                            skos_label_en = text
+                        elif lang_tag == "nl" and not skos_label_nl:
+                            skos_label_nl = text
+                        elif skos_label_other is None:
+                            # #245 fallback: capture first non-en/non-nl tag as a
+                            # last resort. lang_tag is always present in this branch.
+                            skos_label_other = text
+                    elif pred == P_SCHEMA_NAME and text:
+                        # BCP 47 primary subtag (e.g. `nl-NL` → `nl`, `zh-Hans-CN` → `zh`)
+                        primary = lang_tag.split("-", 1)[0].lower()
+                        if primary not in schema_names_by_lang:
+                            schema_names_by_lang[primary] = text
+                    elif pred == P_SCHEMA_ALTERNATE_NAME and text:
+                        primary = lang_tag.split("-", 1)[0].lower()
+                        if primary not in schema_alt_names_by_lang:
+                            schema_alt_names_by_lang[primary] = text
+        except (OSError, UnicodeDecodeError):
+            return None
 
     label_en = None
     label_nl = None
@@ -1218,11 +1489,8 @@ def parse_nt_file(filepath: str, default_type: str, iconclass_resolver=None,
     # `notation` — that column is reserved for Iconclass classifications.
     lat = None
     lon = None
-    if defined_by and defined_by.startswith("POINT"):
-        m_coord = re.match(r"POINT\(([-\d.]+)\s+([-\d.]+)\)", defined_by)
-        if m_coord:
-            lon = float(m_coord.group(1))
-            lat = float(m_coord.group(2))
+    if defined_by:
+        lon, lat = parse_wkt_point(defined_by)
 
     # #245: Other-language fallback before final drop. Recovers entities
     # whose only labels are in French/German/etc. or carry no @lang tag.
@@ -1309,19 +1577,59 @@ def extract_dump(tar_name: str) -> Path | None:
     return extract_dir
 
 
-def parse_dump_dir(dump_dir: Path, default_type: str, iconclass_resolver=None) -> list[dict]:
-    """Parse all N-Triples files in a dump directory."""
-    files = [f for f in os.listdir(dump_dir) if os.path.isfile(dump_dir / f) and not f.startswith(".")]
-    total = len(files)
+# Phase 0 parsing is pure regex/string work, so it scales with processes,
+# not threads. Each worker opens its own read-only iconclass.db connection:
+# the resolver closes over a sqlite3 connection, which can't be pickled.
+PARSE_WORKERS = os.cpu_count() or 1
+PARSE_CHUNKSIZE = 256
+_worker_iconclass_resolver = None
+
+
+def _init_parse_worker(use_iconclass: bool) -> None:
+    global _worker_iconclass_resolver
+    _worker_iconclass_resolver = make_iconclass_resolver() if use_iconclass else None
+
+
+def _parse_nt_file_worker(filepath: str, default_type: str) -> tuple[dict | None, Counter]:
+    stats: Counter = Counter()
+    rec = parse_nt_file(filepath, default_type,
+                        iconclass_resolver=_worker_iconclass_resolver, parse_stats=stats)
+    return rec, stats
+
+
+def parse_dump_dir(dump_dir: Path, default_type: str, iconclass_resolver=None,
+                   workers: int = PARSE_WORKERS) -> list[dict]:
+    """Parse all N-Triples files in a dump directory.
+
+    With ``workers > 1`` files are parsed by a process pool; records come
+    back in directory order either way.
+    """
+    # scandir's cached d_type answers is_file() without a stat() per entry.
+    with os.scandir(dump_dir) as it:
+        paths = [e.path for e in it if not e.name.startswith(".") and e.is_file()]
+    total = len(paths)
     records = []
     parse_stats: Counter = Counter()
-    for i, fname in enumerate(files):
-        if i % 5000 == 0 and i > 0:
-            print(f"    Parsing: {i}/{total}...", flush=True)
-        rec = parse_nt_file(str(dump_dir / fname), default_type,
-                            iconclass_resolver=iconclass_resolver, parse_stats=parse_stats)
-        if rec:
-            records.append(rec)
+    if workers > 1 and total > PARSE_CHUNKSIZE:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker,
+                                 initargs=(iconclass_resolver is not None,)) as ex:
+            results = ex.map(functools.partial(_parse_nt_file_worker, default_type=default_type),
+                             paths, chunksize=PARSE_CHUNKSIZE)
+            for i, (rec, stats) in enumerate(results):
+                if i % 5000 == 0 and i > 0:
+                    print(f"    Parsing: {i}/{total}...", flush=True)
+                if stats:
+                    parse_stats.update(stats)
+                if rec:
+                    records.append(rec)
+    else:
+        for i, path in enumerate(paths):
+            if i % 5000 == 0 and i > 0:
+                print(f"    Parsing: {i}/{total}...", flush=True)
+            rec = parse_nt_file(path, default_type,
+                                iconclass_resolver=iconclass_resolver, parse_stats=parse_stats)
+            if rec:
+                records.append(rec)
     if parse_stats["html_error"]:
         # #317: surface upstream HTML-instead-of-RDF as a counted category rather
         # than a silent zero-triple drop. Re-run scripts/probe_317_html_dumps.py
@@ -1569,18 +1877,22 @@ def _flush_vocab_batch(conn: sqlite3.Connection, records: list[dict]) -> int:
 def run_phase0(conn: sqlite3.Connection):
     """Phase 0: Parse all data dumps into vocabulary table."""
     # Always seed external vocabulary entries regardless of dump availability
-    for ext_id, ext_data in EXTERNAL_VOCAB.items():
-        conn.execute(VOCAB_INSERT_SQL, {
+    conn.executemany(VOCAB_INSERT_SQL, [
+        {
             "id": ext_id, "type": ext_data["type"],
             "label_en": ext_data["label_en"], "label_nl": ext_data["label_nl"],
             "external_id": ext_data["external_id"],
             "broader_id": None, "notation": None, "lat": None, "lon": None,
-        })
-        # Also seed into vocabulary_external_ids so the new table is
-        # consistent with the legacy column for these hand-curated entries.
-        if ext_data.get("external_id"):
-            authority, local_id = classify_authority(ext_data["external_id"])
-            conn.execute(VEI_INSERT_SQL, (ext_id, authority, local_id, ext_data["external_id"]))
+        }
+        for ext_id, ext_data in EXTERNAL_VOCAB.items()
+    ])
+    # Also seed into vocabulary_external_ids so the new table is
+    # consistent with the legacy column for these hand-curated entries.
+    conn.executemany(VEI_INSERT_SQL, [
+        (ext_id, *classify_authority(ext_data["external_id"]), ext_data["external_id"])
+        for ext_id, ext_data in EXTERNAL_VOCAB.items()
+        if ext_data.get("external_id")
+    ])
     conn.commit()
     print(f"  Seeded {len(EXTERNAL_VOCAB)} external vocabulary entries (Getty AAT)")
 
@@ -1643,11 +1955,11 @@ def run_phase0_5(conn: sqlite3.Connection):
     """Seed vocabulary table with curated set names from OAI-PMH ListSets."""
     url = f"{OAI_BASE}?verb=ListSets"
     print("  Fetching ListSets from OAI-PMH...")
-    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-    with urllib.request.urlopen(req, timeout=60) as resp:
-        root = ET.fromstring(resp.read())
+    resp = get_http_session().get(url, headers={"User-Agent": USER_AGENT}, timeout=60)
+    resp.raise_for_status()
+    root = ET.fromstring(resp.content)
 
-    count = 0
+    set_rows = []
     for set_el in root.findall(".//oai:set", NS):
         spec_el = set_el.find("oai:setSpec", NS)
         name_el = set_el.find("oai:setName", NS)
@@ -1657,27 +1969,44 @@ def run_phase0_5(conn: sqlite3.Connection):
         set_name = name_el.text or ""
         if not set_spec or not set_name:
             continue
-        conn.execute(VOCAB_INSERT_SQL, {
+        set_rows.append({
             "id": set_spec, "type": "set",
             "label_en": set_name, "label_nl": set_name,
             "external_id": None, "broader_id": None,
             "notation": None, "lat": None, "lon": None,
         })
-        count += 1
 
+    conn.executemany(VOCAB_INSERT_SQL, set_rows)
     conn.commit()
-    print(f"  Seeded {count} curated set names")
+    print(f"  Seeded {len(set_rows)} curated set names")
 
 
 # ─── Phase 1: OAI-PMH Harvest ───────────────────────────────────────
 
-def fetch_oai_page(url: str) -> ET.Element:
-    """Fetch and parse an OAI-PMH XML page."""
-    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+def fetch_oai_records(url: str) -> tuple[list[dict], str | None]:
+    """Fetch one OAI-PMH page and return ``(records, resumption_token)``.
+
+    The response is streamed through ``ET.iterparse`` and each ``<record>``
+    is extracted and cleared as soon as it closes, so only one record's
+    DOM is alive at a time instead of the whole page (plus its bytes).
+    """
     for attempt in range(3):
         try:
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                return ET.fromstring(resp.read())
+            with get_http_session().get(url, headers={"User-Agent": USER_AGENT},
+                                        timeout=60, stream=True) as resp:
+                resp.raise_for_status()
+                resp.raw.decode_content = True
+                records = []
+                token = None
+                for _event, elem in ET.iterparse(resp.raw, events=("end",)):
+                    if elem.tag == OAI_RECORD:
+                        rec = extract_record(elem)
+                        if rec is not None:
+                            records.append(rec)
+                        elem.clear()
+                    elif elem.tag == OAI_RESUMPTION_TOKEN:
+                        token = elem.text or None
+                return records, token
         except Exception as e:
             if attempt < 2:
                 wait = 5 * (attempt + 1)
@@ -1706,188 +2035,199 @@ def extract_resource_ref(elem) -> str | None:
     return None
 
 
-def extract_records(root: ET.Element) -> list[dict]:
-    """Extract artwork metadata and vocabulary mappings from OAI-PMH EDM records."""
-    records = []
+def extract_record(record: ET.Element) -> dict | None:
+    """Extract artwork metadata and vocabulary mappings from one OAI-PMH EDM
+    record. Returns None for deleted or incomplete records."""
+    header = record.find(OAI_HEADER)
+    if header is None:
+        return None
+    # Skip deleted records
+    if header.get("status") == "deleted":
+        return None
 
-    for record in root.findall(".//oai:record", NS):
-        header = record.find("oai:header", NS)
-        if header is None:
-            continue
-        # Skip deleted records
-        if header.get("status") == "deleted":
-            continue
+    metadata = record.find(OAI_METADATA)
+    if metadata is None:
+        return None
 
-        # Extract setSpec values from header (collection set memberships)
-        set_specs = [el.text for el in header.findall("oai:setSpec", NS) if el.text]
+    # Extract setSpec values from header (collection set memberships)
+    set_specs = [el.text for el in header.findall(OAI_SET_SPEC) if el.text]
 
-        metadata = record.find("oai:metadata", NS)
-        if metadata is None:
-            continue
+    # Find ProvidedCHO — nested inside rdf:RDF > ore:Aggregation > edm:aggregatedCHO
+    cho = metadata.find(".//" + EDM_PROVIDED_CHO)
+    if cho is None:
+        return None
 
-        # Find ProvidedCHO — nested inside rdf:RDF > ore:Aggregation > edm:aggregatedCHO
-        cho = metadata.find(".//{http://www.europeana.eu/schemas/edm/}ProvidedCHO")
-        if cho is None:
-            continue
+    # Extract Linked Art URI from CHO's rdf:about (for Phase 4 resolution)
+    lod_uri = cho.get(RDF_ABOUT, "")
 
-        # Extract Linked Art URI from CHO's rdf:about (for Phase 4 resolution)
-        lod_uri = cho.get(RDF_ABOUT, "")
+    # One pass over CHO's direct children, bucketed by tag, instead of a
+    # findall() child scan per field below. Lists keep document order.
+    cho_children: dict[str, list] = {}
+    for el in cho:
+        cho_children.setdefault(el.tag, []).append(el)
 
-        # Extract object number
-        object_number = ""
-        id_el = cho.find("{http://purl.org/dc/elements/1.1/}identifier")
-        if id_el is not None and id_el.text:
+    # Extract object number
+    object_number = ""
+    for id_el in cho_children.get(DC_IDENTIFIER, ())[:1]:
+        if id_el.text:
             object_number = id_el.text.strip()
 
-        if not object_number:
+    if not object_number:
+        return None
+
+    # Extract title (prefer English)
+    title = ""
+    for t in cho_children.get(DC_TITLE, ()):
+        if t.text:
+            lang = t.get(XML_LANG, "")
+            if lang == "en" or not title:
+                title = t.text.strip()[:500]
+
+    # Collect all vocabulary mappings: (vocab_id, field)
+    mappings: list[tuple[str, str]] = []
+
+    # Extract vocabulary references from CHO element
+    # (XML tag, mapping field name)
+    for xml_tag, field in CHO_VOCAB_FIELDS:
+        for el in cho_children.get(xml_tag, ()):
+            vid = extract_resource_ref(el)
+            if vid:
+                mappings.append((vid, field))
+
+    # Extract creator label and agent metadata from edm:Agent elements
+    # Agents are siblings of ore:Aggregation inside rdf:RDF
+    creator_label = ""
+    creator_vids = {v for v, f in mappings if f == "creator"}
+    for agent in metadata.iter(EDM_AGENT):
+        agent_about = agent.get(RDF_ABOUT, "")
+        if agent_about.rsplit("/", 1)[-1] not in creator_vids:
             continue
 
-        # Extract title (prefer English)
-        title = ""
-        for t in cho.findall("{http://purl.org/dc/elements/1.1/}title"):
-            if t.text:
-                lang = t.get(XML_LANG, "")
-                if lang == "en" or not title:
-                    title = t.text.strip()[:500]
-
-        # Collect all vocabulary mappings: (vocab_id, field)
-        mappings: list[tuple[str, str]] = []
-
-        # Extract vocabulary references from CHO element
-        # (XML tag, mapping field name)
-        for xml_tag, field in CHO_VOCAB_FIELDS:
-            for el in cho.findall(xml_tag):
-                vid = extract_resource_ref(el)
-                if vid:
-                    mappings.append((vid, field))
-
-        # Extract creator label and agent metadata from edm:Agent elements
-        # Agents are siblings of ore:Aggregation inside rdf:RDF
-        creator_label = ""
-        for agent in metadata.iter("{http://www.europeana.eu/schemas/edm/}Agent"):
-            agent_about = agent.get(RDF_ABOUT, "")
-            if not any(f == "creator" and agent_about.endswith(v) for v, f in mappings):
+        # Extract agent's name
+        for pref_label in agent.findall(SKOS_PREF_LABEL):
+            if pref_label.text:
+                lang = pref_label.get(XML_LANG, "")
+                if lang == "en" or not creator_label:
+                    creator_label = pref_label.text.strip()
+
+        # Extract birth/death place (rdaGr2 namespace, not edm)
+        for bp in agent.findall(RDA_PLACE_OF_BIRTH):
+            vid = extract_resource_ref(bp)
+            if vid:
+                mappings.append((vid, "birth_place"))
+        for dp in agent.findall(RDA_PLACE_OF_DEATH):
+            vid = extract_resource_ref(dp)
+            if vid:
+                mappings.append((vid, "death_place"))
+
+        # Extract profession/occupation
+        for prof in agent.findall(RDA_PROFESSION):
+            vid = extract_resource_ref(prof)
+            if vid:
+                mappings.append((vid, "profession"))
+
+    # Add collection set mappings from header setSpec values
+    for spec in set_specs:
+        mappings.append((spec, "collection_set"))
+
+    # Walk SKOS Concept / edm:Place / rdf:Description entity definitions
+    # at the metadata root and capture their owl:sameAs URIs. This is the
+    # exclusive channel for subject external IDs (Iconclass on dc:subject)
+    # and the primary channel for spatial external IDs (TGN, GeoNames,
+    # Wikidata on dcterms:spatial).
+    ext_ids: list[tuple[str, str, str, str]] = []  # (vocab_id, authority, id, uri)
+    for tag in SAME_AS_ENTITY_TAGS:
+        for ent in metadata.iter(tag):
+            ent_uri = ent.get(RDF_ABOUT, "")
+            if not ent_uri:
                 continue
-
-            # Extract agent's name
-            for pref_label in agent.findall("{http://www.w3.org/2004/02/skos/core#}prefLabel"):
-                if pref_label.text:
-                    lang = pref_label.get(XML_LANG, "")
-                    if lang == "en" or not creator_label:
-                        creator_label = pref_label.text.strip()
-
-            # Extract birth/death place (rdaGr2 namespace, not edm)
-            for bp in agent.findall("{http://rdvocab.info/ElementsGr2/}placeOfBirth"):
-                vid = extract_resource_ref(bp)
-                if vid:
-                    mappings.append((vid, "birth_place"))
-            for dp in agent.findall("{http://rdvocab.info/ElementsGr2/}placeOfDeath"):
-                vid = extract_resource_ref(dp)
-                if vid:
-                    mappings.append((vid, "death_place"))
-
-            # Extract profession/occupation
-            for prof in agent.findall("{http://rdvocab.info/ElementsGr2/}professionOrOccupation"):
-                vid = extract_resource_ref(prof)
-                if vid:
-                    mappings.append((vid, "profession"))
-
-        # Add collection set mappings from header setSpec values
-        for spec in set_specs:
-            mappings.append((spec, "collection_set"))
-
-        # Walk SKOS Concept / edm:Place / rdf:Description entity definitions
-        # at the metadata root and capture their owl:sameAs URIs. This is the
-        # exclusive channel for subject external IDs (Iconclass on dc:subject)
-        # and the primary channel for spatial external IDs (TGN, GeoNames,
-        # Wikidata on dcterms:spatial).
-        ext_ids: list[tuple[str, str, str, str]] = []  # (vocab_id, authority, id, uri)
-        for tag in (
-            f"{{{NS['skos']}}}Concept",
-            f"{{{NS['edm']}}}Place",
-            f"{{{NS['rdf']}}}Description",
-        ):
-            for ent in metadata.iter(tag):
-                ent_uri = ent.get(RDF_ABOUT, "")
-                if not ent_uri:
+            vocab_id = ent_uri.rsplit("/", 1)[-1]
+            for sa in ent.findall(OWL_SAME_AS):
+                sa_uri = sa.get(RDF_RESOURCE, "")
+                if not sa_uri:
                     continue
-                vocab_id = ent_uri.rsplit("/", 1)[-1]
-                for sa in ent.findall(OWL_SAME_AS):
-                    sa_uri = sa.get(RDF_RESOURCE, "")
-                    if not sa_uri:
-                        continue
-                    authority, local_id = classify_authority(sa_uri)
-                    ext_ids.append((vocab_id, authority, local_id, sa_uri))
-
-        # Multiple language variants joined with " | " (matches inscription /
-        # provenance / credit_line convention from Phase 4).
-        extent_parts: list[str] = []
-        for ext in cho.findall("{http://purl.org/dc/terms/}extent"):
-            if ext.text and ext.text.strip():
-                extent_parts.append(ext.text.strip())
-        extent_text = " | ".join(extent_parts) if extent_parts else None
-
-        # Extract rights URI from ore:Aggregation
-        rights_uri = ""
-        agg = metadata.find(".//{http://www.openarchives.org/ore/terms/}Aggregation")
-        if agg is not None:
-            rights_el = agg.find("{http://www.europeana.eu/schemas/edm/}rights")
-            if rights_el is not None:
-                rights_uri = rights_el.get(RDF_RESOURCE, "")
-
-        # Check for image availability and extract IIIF ID from edm:isShownBy / edm:object
-        has_image = 0
-        iiif_id = None
-        if agg is not None:
-            is_shown = agg.find("{http://www.europeana.eu/schemas/edm/}isShownBy")
-            edm_obj = agg.find("{http://www.europeana.eu/schemas/edm/}object")
-
-            # Extract IIIF URL from isShownBy (two RDF/XML shapes):
-            #   1. <edm:isShownBy rdf:resource="https://iiif.micr.io/{UUID}/..."/>
-            #   2. <edm:isShownBy><edm:WebResource rdf:about="https://iiif.micr.io/{UUID}/..."/></edm:isShownBy>
-            iiif_url = ""
-            if is_shown is not None:
-                has_image = 1
-                iiif_url = is_shown.get(RDF_RESOURCE, "")
-                if not iiif_url:
-                    # Nested WebResource — URL is on rdf:about of the child element
-                    child = next(iter(is_shown), None)
-                    if child is not None:
-                        iiif_url = child.get(RDF_ABOUT, "")
-            elif edm_obj is not None:
-                has_image = 1
-                iiif_url = edm_obj.get(RDF_RESOURCE, "")
-                if not iiif_url:
-                    child = next(iter(edm_obj), None)
-                    if child is not None:
-                        iiif_url = child.get(RDF_ABOUT, "")
-
-            # Extract UUID from URL: https://iiif.micr.io/{UUID}/full/max/0/default.jpg
-            if iiif_url:
-                m = IIIF_ID_RE.match(iiif_url)
-                if m:
-                    iiif_id = m.group(1)
-
-        records.append({
-            "object_number": object_number,
-            "title": title,
-            "creator_label": creator_label,
-            "rights_uri": rights_uri,
-            "linked_art_uri": lod_uri,
-            "has_image": has_image,
-            "iiif_id": iiif_id,
-            "mappings": mappings,
-            "ext_ids": ext_ids,
-            "extent_text": extent_text,
-        })
+                authority, local_id = classify_authority(sa_uri)
+                ext_ids.append((vocab_id, authority, local_id, sa_uri))
+
+    # Multiple language variants joined with " | " (matches inscription /
+    # provenance / credit_line convention from Phase 4).
+    extent_parts: list[str] = []
+    for ext in cho_children.get(DCTERMS_EXTENT, ()):
+        if ext.text and ext.text.strip():
+            extent_parts.append(ext.text.strip())
+    extent_text = " | ".join(extent_parts) if extent_parts else None
+
+    # Extract rights URI from ore:Aggregation
+    rights_uri = ""
+    agg = metadata.find(".//" + ORE_AGGREGATION)
+    if agg is not None:
+        rights_el = agg.find(EDM_RIGHTS)
+        if rights_el is not None:
+            rights_uri = rights_el.get(RDF_RESOURCE, "")
+
+    # Check for image availability and extract IIIF ID from edm:isShownBy / edm:object
+    has_image = 0
+    iiif_id = None
+    if agg is not None:
+        is_shown = agg.find(EDM_IS_SHOWN_BY)
+        edm_obj = agg.find(EDM_OBJECT)
+
+        # Extract IIIF URL from isShownBy (two RDF/XML shapes):
+        #   1. <edm:isShownBy rdf:resource="https://iiif.micr.io/{UUID}/..."/>
+        #   2. <edm:isShownBy><edm:WebResource rdf:about="https://iiif.micr.io/{UUID}/..."/></edm:isShownBy>
+        iiif_url = ""
+        if is_shown is not None:
+            has_image = 1
+            iiif_url = is_shown.get(RDF_RESOURCE, "")
+            if not iiif_url:
+                # Nested WebResource — URL is on rdf:about of the child element
+                child = next(iter(is_shown), None)
+                if child is not None:
+                    iiif_url = child.get(RDF_ABOUT, "")
+        elif edm_obj is not None:
+            has_image = 1
+            iiif_url = edm_obj.get(RDF_RESOURCE, "")
+            if not iiif_url:
+                child = next(iter(edm_obj), None)
+                if child is not None:
+                    iiif_url = child.get(RDF_ABOUT, "")
+
+        # Extract UUID from URL: https://iiif.micr.io/{UUID}/full/max/0/default.jpg
+        if iiif_url:
+            m = IIIF_ID_RE.match(iiif_url)
+            if m:
+                iiif_id = m.group(1)
 
+    return {
+        "object_number": object_number,
+        "title": title,
+        "creator_label": creator_label,
+        "rights_uri": rights_uri,
+        "linked_art_uri": lod_uri,
+        "has_image": has_image,
+        "iiif_id": iiif_id,
+        "mappings": mappings,
+        "ext_ids": ext_ids,
+        "extent_text": extent_text,
+    }
+
+
+def extract_records(root: ET.Element) -> list[dict]:
+    """Extract artwork metadata and vocabulary mappings from OAI-PMH EDM records."""
+    records = []
+    for record in root.findall(".//" + OAI_RECORD):
+        rec = extract_record(record)
+        if rec is not None:
+            records.append(rec)
     return records
 
 
 def save_checkpoint(token: str, page: int):
-    """Save harvest progress to checkpoint file."""
-    with open(CHECKPOINT_PATH, "w") as f:
+    """Save harvest progress to checkpoint file (atomically, via rename)."""
+    tmp_path = CHECKPOINT_PATH.with_name(CHECKPOINT_PATH.name + ".tmp")
+    with open(tmp_path, "w") as f:
         json.dump({"resumption_token": token, "page": page}, f)
+    os.replace(tmp_path, CHECKPOINT_PATH)
 
 
 def load_checkpoint() -> tuple[str, int] | None:
@@ -1902,6 +2242,28 @@ def load_checkpoint() -> tuple[str, int] | None:
         return None
 
 
+def _prefetch_oai_pages(url: str, max_pages: int | None, pages: queue.Queue) -> None:
+    """Producer thread for Phase 1: fetch OAI pages ahead of the DB writer.
+
+    Follows resumptionTokens itself (single producer, so page order is kept)
+    and queues ``(records, token)`` per page; ``token`` is None on the last page.
+    Ends with a ``None`` sentinel, or the exception if a fetch fails for good.
+    """
+    fetched = 0
+    try:
+        while url:
+            records, token = fetch_oai_records(url)
+            pages.put((records, token))
+            fetched += 1
+            if max_pages and fetched >= max_pages:
+                break
+            url = f"{OAI_BASE}?verb=ListRecords&resumptionToken={token}" if token else None
+    except Exception as e:
+        pages.put(e)
+        return
+    pages.put(None)
+
+
 def run_phase1(conn: sqlite3.Connection, resume: bool = False, max_pages: int | None = None):
     """Phase 1: Harvest OAI-PMH records. If max_pages is set, stop after that many pages (~200 records/page)."""
     start_page = 0
@@ -1919,43 +2281,67 @@ def run_phase1(conn: sqlite3.Connection, resume: bool = False, max_pages: int |
     page = start_page
     total_artworks = 0
     total_mappings = 0
+    seen_objects: set[str] = set()
+    # Checkpoint only at commit boundaries, so --resume never skips pages
+    # whose rows were still in an uncommitted transaction.
+    last_token: str | None = None
+    pending_rows = 0
     t0 = time.time()
+    last_commit = time.monotonic()
+
+    # Fetch runs one page ahead (bounded queue) on a background thread so the
+    # HTTP round-trip overlaps XML extraction and SQLite inserts.
+    pages: queue.Queue = queue.Queue(maxsize=4)
+    threading.Thread(target=_prefetch_oai_pages, args=(url, max_pages, pages),
+                     daemon=True).start()
 
     while url:
+        item = pages.get()
+        if item is None:  # producer finished (normally unreachable: url goes None first)
+            url = None
+            break
         page += 1
-        try:
-            root = fetch_oai_page(url)
-        except Exception as e:
-            print(f"  FATAL error on page {page}: {e}")
+        if isinstance(item, Exception):
+            print(f"  FATAL error on page {page}: {item}")
             print(f"  Use --resume to continue from last checkpoint")
             break
-
-        records = extract_records(root)
-
+        records, token = item
+
+        # One executemany per table per page; rows stay in the open implicit
+        # transaction until the row/time-based commit below. Duplicates are
+        # dropped in Python first (artworks across the run, mappings within the
+        # page) so SQLite only sees rows that can land; OR IGNORE still covers
+        # rows committed by an earlier, resumed run.
+        artwork_rows = []
         for rec in records:
-            conn.execute(
-                "INSERT OR IGNORE INTO artworks (object_number, title, creator_label, rights_uri, linked_art_uri, has_image, iiif_id, extent_text) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                (rec["object_number"], rec["title"], rec["creator_label"], rec["rights_uri"], rec["linked_art_uri"], rec["has_image"], rec["iiif_id"], rec.get("extent_text")),
-            )
-            for vocab_id, field in rec["mappings"]:
-                conn.execute(
-                    "INSERT OR IGNORE INTO mappings (object_number, vocab_id, field) VALUES (?, ?, ?)",
-                    (rec["object_number"], vocab_id, field),
-                )
-                total_mappings += 1
-            ext_ids = rec.get("ext_ids")
-            if ext_ids:
-                conn.executemany(VEI_INSERT_SQL, ext_ids)
+            if rec["object_number"] in seen_objects:
+                continue
+            seen_objects.add(rec["object_number"])
+            artwork_rows.append((rec["object_number"], rec["title"], rec["creator_label"], rec["rights_uri"], rec["linked_art_uri"], rec["has_image"], rec["iiif_id"], rec.get("extent_text")))
+        conn.executemany(
+            "INSERT OR IGNORE INTO artworks (object_number, title, creator_label, rights_uri, linked_art_uri, has_image, iiif_id, extent_text) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            artwork_rows,
+        )
+        mapping_rows = list(dict.fromkeys(
+            (rec["object_number"], vocab_id, field)
+            for rec in records for vocab_id, field in rec["mappings"]
+        ))
+        conn.executemany(
+            "INSERT OR IGNORE INTO mappings (object_number, vocab_id, field) VALUES (?, ?, ?)",
+            mapping_rows,
+        )
+        total_mappings += len(mapping_rows)
+        ext_id_rows = [row for rec in records for row in rec.get("ext_ids") or ()]
+        if ext_id_rows:
+            conn.executemany(VEI_INSERT_SQL, ext_id_rows)
+        pending_rows += len(artwork_rows) + len(mapping_rows) + len(ext_id_rows)
 
         total_artworks += len(records)
 
         # Check for resumption token
-        token_el = root.find(".//oai:resumptionToken", NS)
-        if token_el is not None and token_el.text:
-            token = token_el.text
+        if token:
             url = f"{OAI_BASE}?verb=ListRecords&resumptionToken={token}"
-            # Save checkpoint
-            save_checkpoint(token, page)
+            last_token = token
         else:
             url = None
 
@@ -1972,10 +2358,19 @@ def run_phase1(conn: sqlite3.Connection, resume: bool = False, max_pages: int |
                 flush=True,
             )
 
-        if page % BATCH_SIZE == 0:
+        if (pending_rows >= PHASE1_COMMIT_ROWS
+                or time.monotonic() - last_commit >= PHASE1_COMMIT_SECONDS):
             conn.commit()
+            pending_rows = 0
+            last_commit = time.monotonic()
+            if url and last_token:
+                save_checkpoint(last_token, page)
 
     conn.commit()
+    if url and last_token:
+        # Stopped early (fetch failed for good): checkpoint the last page
+        # that made it into the DB.
+        save_checkpoint(last_token, page - 1)
     elapsed = time.time() - t0
     print(f"  Harvest complete: {total_artworks:,} artworks, {total_mappings:,} mappings, {page} pages, {elapsed:.0f}s")
 
@@ -2024,7 +2419,7 @@ def resolve_uri(entity_id: str) -> tuple[dict | None, str | None]:
         return None, f"http_{resp.status_code}"
 
     try:
-        data = resp.json()
+        data = json_loads(resp.content)
     except (json.JSONDecodeError, ValueError):
         return None, "parse_error"
 
@@ -2035,8 +2430,7 @@ def resolve_uri(entity_id: str) -> tuple[dict | None, str | None]:
 
     label_en = None
     label_nl = None
-    name_variants = []  # All name variants for persons
-    seen_names = set()  # Deduplicate (content, lang) pairs
+    name_variants: dict[tuple, dict] = {}  # (content, lang) → first variant seen
     for name in data.get("identified_by", []):
         content = name.get("content", "")
         if not content or not isinstance(content, str):
@@ -2060,23 +2454,16 @@ def resolve_uri(entity_id: str) -> tuple[dict | None, str | None]:
 
             classification = None
             for c in name.get("classified_as", []):
-                cid = c.get("id", "")
-                for suffix, clabel in AAT_NAME_CLASSIFICATION.items():
-                    if cid.endswith(suffix):
-                        classification = clabel
-                        break
+                classification = AAT_NAME_CLASSIFICATION.get(c.get("id", "").rsplit("/", 1)[-1])
                 if classification:
                     break
 
-            key = (content, lang)
-            if key not in seen_names:
-                seen_names.add(key)
-                name_variants.append({
-                    "person_id": entity_id,
-                    "name": content,
-                    "lang": lang,
-                    "classification": classification,
-                })
+            name_variants.setdefault((content, lang), {
+                "person_id": entity_id,
+                "name": content,
+                "lang": lang,
+                "classification": classification,
+            })
 
     # #276: collect all equivalent[] authority IDs into _external_ids; the
     # single-value `external_id` column still gets the Wikidata-preferred
@@ -2101,13 +2488,10 @@ def resolve_uri(entity_id: str) -> tuple[dict | None, str | None]:
     lon = None
     if vocab_type == "place":
         defined_by = data.get("defined_by", "")
-        if isinstance(defined_by, str) and defined_by.startswith("POINT"):
+        if isinstance(defined_by, str):
             # Parse POINT(lon lat). #328: don't assign WKT to `notation` —
             # that column is reserved for Iconclass classifications.
-            m = re.match(r"POINT\(([-\d.]+)\s+([-\d.]+)\)", defined_by)
-            if m:
-                lon = float(m.group(1))
-                lat = float(m.group(2))
+            lon, lat = parse_wkt_point(defined_by)
 
     return {
         "id": entity_id,
@@ -2119,7 +2503,7 @@ def resolve_uri(entity_id: str) -> tuple[dict | None, str | None]:
         "notation": notation,
         "lat": lat,
         "lon": lon,
-        "name_variants": name_variants,
+        "name_variants": list(name_variants.values()),
         "_external_ids": external_ids_list,
     }, None
 
@@ -2155,7 +2539,7 @@ def retry_transient_failures(conn: sqlite3.Connection, max_rounds: int = 3) -> i
     print(f"  Retry sweep: {len(remaining)} transient failures to replay")
 
     # Retry rounds run in parallel within a round (HTTP in pool, SQL in main
-    # thread via as_completed) and serialise across rounds so the backoff
+    # thread via iter_completed) and serialise across rounds so the backoff
     # sleep has any effect. Thread count is intentionally lower than
     # DEFAULT_THREADS — a retry sweep is second contact with a service we
     # just hammered, so be politer.
@@ -2175,9 +2559,9 @@ def retry_transient_failures(conn: sqlite3.Connection, max_rounds: int = 3) -> i
         next_remaining: list[str] = []
         recovered_this_round = 0
         with ThreadPoolExecutor(max_workers=RETRY_THREADS) as pool:
-            futures = {pool.submit(resolve_uri, uri): uri for uri in remaining}
-            for future in as_completed(futures):
-                uri = futures[future]
+            for uri, future in iter_completed(
+                pool, resolve_uri, remaining, window=2 * RETRY_THREADS,
+            ):
                 result, new_reason = future.result()
                 if result:
                     ext_ids = result.pop("_external_ids", [])
@@ -2238,11 +2622,12 @@ def run_phase2(conn: sqlite3.Connection):
         print("  Integer-encoded schema: all vocab references are valid FKs, nothing to resolve.")
         unmatched = []
     else:
+        # Dedupe first (a walk of the idx_mappings_vocab covering index), then
+        # probe vocabulary once per distinct ID rather than once per mapping row.
         unmatched = [row[0] for row in cur.execute("""
-            SELECT DISTINCT m.vocab_id
-            FROM mappings m
-            LEFT JOIN vocabulary v ON m.vocab_id = v.id
-            WHERE v.id IS NULL
+            SELECT m.vocab_id
+            FROM (SELECT DISTINCT vocab_id FROM mappings) m
+            WHERE NOT EXISTS (SELECT 1 FROM vocabulary v WHERE v.id = m.vocab_id)
         """).fetchall()]
 
     if not unmatched:
@@ -2259,6 +2644,7 @@ def run_phase2(conn: sqlite3.Connection):
     resolved = 0
     person_names_count = 0
     t0 = time.time()
+    next_log = time.monotonic() + PROGRESS_INTERVAL_S
 
     FAILURES_INSERT = (
         "INSERT OR REPLACE INTO phase2_failures (uri, reason) VALUES (?, ?)"
@@ -2267,12 +2653,11 @@ def run_phase2(conn: sqlite3.Connection):
     failures_by_reason: Counter[str] = Counter()
 
     with ThreadPoolExecutor(max_workers=DEFAULT_THREADS) as pool:
-        futures = {pool.submit(resolve_uri, eid): eid for eid in unmatched}
         batch = []
         name_batch = []
 
-        for i, future in enumerate(as_completed(futures), 1):
-            eid = futures[future]
+        completed = iter_completed(pool, resolve_uri, unmatched, window=2 * DEFAULT_THREADS)
+        for i, (eid, future) in enumerate(completed, 1):
             result, reason = future.result()
             if result:
                 batch.append(result)
@@ -2303,7 +2688,8 @@ def run_phase2(conn: sqlite3.Connection):
                 conn.commit()
                 batch = []
 
-            if i % 1000 == 0:
+            if time.monotonic() >= next_log:
+                next_log = time.monotonic() + PROGRESS_INTERVAL_S
                 elapsed = time.time() - t0
                 rate = i / elapsed
                 remaining = (len(unmatched) - i) / rate
@@ -2365,25 +2751,34 @@ def has_classification(classified_as: list | None, uris: str | set[str]) -> bool
     )
 
 
-def find_statements(referred_to_by: list | None, aat_uri: str) -> list[str]:
-    """Find all referred_to_by statements matching a given AAT classification.
+def find_statements(referred_to_by: list | None, aat_uris: tuple[str, ...]) -> dict[str, list[str]]:
+    """Bin referred_to_by statement texts by AAT classification in one pass.
 
-    Returns all matching texts concatenated with ' | ' delimiter.
-    Collects ALL languages — inscriptions are often in Latin/Dutch/mixed.
+    Returns ``{aat_uri: [texts]}`` for every URI in ``aat_uris`` (empty list
+    when nothing matches). A statement classified under several of the URIs
+    lands in each of their lists. Collects ALL languages — inscriptions are
+    often in Latin/Dutch/mixed.
     """
+    binned: dict[str, list[str]] = {uri: [] for uri in aat_uris}
     if not referred_to_by:
-        return []
-    texts = []
+        return binned
     for stmt in referred_to_by:
         if not isinstance(stmt, dict):
             continue
-        if has_classification(stmt.get("classified_as"), aat_uri):
-            content = stmt.get("content", "")
-            if isinstance(content, list):
-                texts.extend(s for s in content if isinstance(s, str))
-            elif content:
-                texts.append(content)
-    return texts
+        matched = {
+            cid for c in stmt.get("classified_as") or ()
+            if (cid := c.get("id", "") if isinstance(c, dict) else str(c)) in binned
+        }
+        if not matched:
+            continue
+        content = stmt.get("content", "")
+        if isinstance(content, list):
+            texts = [s for s in content if isinstance(s, str)]
+        else:
+            texts = [content] if content else []
+        for uri in matched:
+            binned[uri].extend(texts)
+    return binned
 
 
 # Conversion factors from unit to centimeters
@@ -3085,22 +3480,18 @@ def resolve_artwork(uri: str) -> dict | None:
         return None
 
     try:
-        data = resp.json()
+        data = json_loads(resp.content)
     except ValueError as e:
         print(f"    Error for {uri}: {e}", flush=True)
         return None
 
     referred_to_by = data.get("referred_to_by", [])
 
-    # Extract text fields by AAT classification
-    def join_statements(aat_uri: str) -> str | None:
-        texts = find_statements(referred_to_by, aat_uri)
-        return " | ".join(texts) if texts else None
-
-    inscription_text = join_statements(AAT_INSCRIPTIONS)
-    provenance_text = join_statements(AAT_PROVENANCE)
-    credit_line = join_statements(AAT_CREDIT_LINE)
-    description_text = join_statements(AAT_DESCRIPTION)
+    # Extract text fields by AAT classification (texts joined with ' | ')
+    inscription_text, provenance_text, credit_line, description_text = (
+        " | ".join(texts) or None
+        for texts in find_statements(referred_to_by, STATEMENT_TYPES).values()
+    )
 
     # Structured dimensions
     dimensions = data.get("dimension", [])
@@ -3302,15 +3693,15 @@ def run_phase4(conn: sqlite3.Connection, threads: int = DEFAULT_THREADS):
         print("  To re-run Tier 2 resolution, start from a fresh Phase 1+2 harvest.")
         return
 
-    # Detect schema early — needed by seed step and MAPPING_INSERT_SQL below
+    # Detect schema early — needed by seed step and the mapping encoder below
     int_mappings = "field_id" in get_columns(conn, "mappings")
 
     # Seed AAT source-type vocabulary entries (used_object_of_type).
     # These are external AAT URIs not present in the Rijksmuseum vocabulary dump.
     # _extract_ids() emits the AAT suffix (e.g. "300102051") as vocab_id, so we insert
-    # with that as the primary key to match the MAPPING_INSERT_SQL JOIN.
+    # with that as the primary key so the mapping encoder can resolve it.
     # vocab_int_id is an explicit INTEGER column (NOT a rowid alias) used by the
-    # integer-schema MAPPING_INSERT_SQL — seeded rows must get a value.
+    # integer-schema mapping encoder — seeded rows must get a value.
     max_vid = 0
     if int_mappings:
         max_vid = cur.execute("SELECT COALESCE(MAX(vocab_int_id), 0) FROM vocabulary").fetchone()[0]
@@ -3331,7 +3722,7 @@ def run_phase4(conn: sqlite3.Connection, threads: int = DEFAULT_THREADS):
             print(f"  Seeded {seeded} AAT source-type vocabulary entries.")
 
     # Ensure new field names exist in field_lookup (integer-schema DBs).
-    # The MAPPING_INSERT_SQL JOINs against field_lookup — missing entries cause silent drops.
+    # The mapping encoder resolves names via field_lookup — missing entries cause silent drops.
     # 'theme' carries la-framed `about[]` thematic-vocab mappings.
     if int_mappings:
         fl_added = 0
@@ -3388,6 +3779,7 @@ def run_phase4(conn: sqlite3.Connection, threads: int = DEFAULT_THREADS):
         art_id_map = dict(conn.execute("SELECT object_number, art_id FROM artworks").fetchall())
 
     MAPPING_INSERT_SQL = _mapping_insert_sql(int_mappings)
+    encode_mappings = _mapping_row_encoder(conn, int_mappings)
 
     # Guard: only insert citations if the table was created (it will always exist
     # for harvests that include the updated schema; older DBs may not have it).
@@ -3425,6 +3817,7 @@ def run_phase4(conn: sqlite3.Connection, threads: int = DEFAULT_THREADS):
     citation_count = 0
     with_record_timestamp = 0
     t0 = time.time()
+    next_log = time.monotonic() + PROGRESS_INTERVAL_S
 
     # Dedup cache for publication records (publication_id → Schema.org dict|None).
     # Keyed by publication_id (integer path segment, e.g. 301154354).
@@ -3450,7 +3843,7 @@ def run_phase4(conn: sqlite3.Connection, threads: int = DEFAULT_THREADS):
                 allow_redirects=True,
             )
             if resp.ok:
-                pub = resp.json()
+                pub = json_loads(resp.content)
             else:
                 pub = None
         except Exception:
@@ -3485,212 +3878,228 @@ def run_phase4(conn: sqlite3.Connection, threads: int = DEFAULT_THREADS):
         WHERE object_number = ?
     """
 
-    with ThreadPoolExecutor(max_workers=threads) as pool:
-        # Submit in batches to avoid excessive memory for futures dict
-        batch_start = 0
-        commit_batch_size = 500
+    # The artworks UPDATE and mappings INSERTs are buffered per commit window
+    # and written with one executemany each, right before the commit.
+    tier2_rows: list[tuple] = []
+    not_found_rows: list[tuple[str]] = []
+    mapping_rows: list[tuple[str, str, str]] = []
 
-        while batch_start < total:
-            batch_end = min(batch_start + commit_batch_size, total)
-            batch = pending[batch_start:batch_end]
-
-            futures = {
-                pool.submit(resolve_artwork, uri): (obj_num, uri)
-                for obj_num, uri in batch
-            }
+    def flush_writes():
+        conn.executemany(TIER2_UPDATE_SQL, tier2_rows)
+        conn.executemany("UPDATE artworks SET tier2_done = 1 WHERE object_number = ?", not_found_rows)
+        conn.executemany(MAPPING_INSERT_SQL, encode_mappings(mapping_rows))
+        conn.commit()
+        tier2_rows.clear()
+        not_found_rows.clear()
+        mapping_rows.clear()
+
+    def report_progress():
+        elapsed = time.time() - t0
+        rate = processed / elapsed if elapsed > 0 else 0
+        remaining = (total - processed) / rate if rate > 0 else 0
+        print(
+            f"  {processed:,}/{total:,} ({succeeded:,} ok, {failed:,} failed, {not_found:,} 404, "
+            f"{rate:.0f}/s, ~{remaining / 60:.0f}min left)",
+            flush=True,
+        )
 
-            for future in as_completed(futures):
-                obj_num, uri = futures[future]
-                processed += 1
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        # Rolling window of 2x threads in flight; commit every 500 results,
+        # progress every PROGRESS_INTERVAL_S.
+        # Dispatch runs on a background thread so submissions continue while
+        # this (writer) thread is inside flush_writes() or the child-table
+        # inserts; up to one commit batch of finished results can queue up.
+        commit_batch_size = 500
 
-                try:
-                    result = future.result()
-                except Exception:
-                    result = None
+        for (obj_num, uri), future in iter_in_background(
+            iter_completed(pool, resolve_artwork, pending, window=2 * threads,
+                           arg=lambda p: p[1]),
+            maxsize=commit_batch_size,
+        ):
+            if processed and processed % commit_batch_size == 0:
+                flush_writes()
+            if time.monotonic() >= next_log:
+                next_log = time.monotonic() + PROGRESS_INTERVAL_S
+                report_progress()
+            processed += 1
 
-                if result is None:
-                    failed += 1
-                    # Don't mark tier2_done — leave for retry
-                    continue
+            try:
+                result = future.result()
+            except Exception:
+                result = None
 
-                if result.get("_status") == "not_found":
-                    not_found += 1
-                    # Mark as done so we don't retry 404s
-                    conn.execute("UPDATE artworks SET tier2_done = 1 WHERE object_number = ?", (obj_num,))
-                    continue
+            if result is None:
+                failed += 1
+                # Don't mark tier2_done — leave for retry
+                continue
 
-                succeeded += 1
-                if result["inscription_text"]:
-                    with_inscription += 1
-                if result["provenance_text"]:
-                    with_provenance += 1
-                if result["credit_line"]:
-                    with_credit += 1
-                if result["description_text"]:
-                    with_description += 1
-                if result["height_cm"] is not None or result["width_cm"] is not None:
-                    with_dimensions += 1
-                if result["narrative_text"]:
-                    with_narrative += 1
-                if result["date_earliest"] is not None:
-                    with_dates += 1
-                if result["title_all_text"]:
-                    with_titles += 1
-                if result.get("creator_label"):
-                    with_creator_label += 1
-
-                conn.execute(TIER2_UPDATE_SQL, (
-                    result["inscription_text"],
-                    result["provenance_text"],
-                    result["credit_line"],
-                    result["description_text"],
-                    result["height_cm"],
-                    result["width_cm"],
-                    result["depth_cm"],
-                    result["diameter_cm"],
-                    result["weight_g"],
-                    result["dimension_note"],
-                    result["narrative_text"],
-                    result["date_earliest"],
-                    result["date_latest"],
-                    result["date_display"],
-                    result["current_location"],
-                    result["provenance_text_hash"],
-                    result["title_all_text"],
-                    result.get("creator_label"),
-                    result.get("record_created"),
-                    result.get("record_modified"),
-                    result.get("visualitem_uri"),
-                    obj_num,
-                ))
-                if result.get("record_created") or result.get("record_modified"):
-                    with_record_timestamp += 1
-
-                # Insert production role, attribution qualifier, creator, place, and source type mappings
-                for vocab_id, field in chain(result["roles"], result["qualifiers"], result["creators"], result["places"], result["source_types"]):
-                    conn.execute(MAPPING_INSERT_SQL, (obj_num, vocab_id, field))
-                role_count += len(result["roles"])
-                qualifier_count += len(result["qualifiers"])
-                creator_count += len(result["creators"])
-                place_count += len(result["places"])
-                source_type_count += len(result["source_types"])
-
-                # New-table inserts require art_id. The bootstrap block at the top
-                # of run_phase4 guarantees art_id exists, so has_art_id should be
-                # True — but keep the fallback so this function stays robust if
-                # the bootstrap is ever disabled or the caller reshapes the schema.
-                art_id = art_id_map.get(obj_num) if has_art_id else None
-
-                if art_id is not None:
-                    # Insert modifications
-                    for seq, mod in enumerate(result.get("modifications", [])):
-                        conn.execute(
-                            "INSERT OR IGNORE INTO modifications (art_id, seq, modifier_uri, date_display, date_begin, date_end, description) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                            (art_id, seq, mod["modifier_uri"], mod["date_display"], mod["date_begin"], mod["date_end"], mod["description"]),
-                        )
-                    modification_count += len(result.get("modifications", []))
+            if result.get("_status") == "not_found":
+                not_found += 1
+                # Mark as done so we don't retry 404s
+                not_found_rows.append((obj_num,))
+                continue
 
-                    # Insert related objects
-                    for ro in result.get("related_objects", []):
-                        conn.execute(
-                            "INSERT OR IGNORE INTO related_objects (art_id, related_la_uri, relationship_en, relationship_nl) VALUES (?, ?, ?, ?)",
-                            (art_id, ro["related_la_uri"], ro["relationship_en"], ro.get("relationship_nl")),
-                        )
-                    related_object_count += len(result.get("related_objects", []))
+            succeeded += 1
+            if result["inscription_text"]:
+                with_inscription += 1
+            if result["provenance_text"]:
+                with_provenance += 1
+            if result["credit_line"]:
+                with_credit += 1
+            if result["description_text"]:
+                with_description += 1
+            if result["height_cm"] is not None or result["width_cm"] is not None:
+                with_dimensions += 1
+            if result["narrative_text"]:
+                with_narrative += 1
+            if result["date_earliest"] is not None:
+                with_dates += 1
+            if result["title_all_text"]:
+                with_titles += 1
+            if result.get("creator_label"):
+                with_creator_label += 1
+
+            tier2_rows.append((
+                result["inscription_text"],
+                result["provenance_text"],
+                result["credit_line"],
+                result["description_text"],
+                result["height_cm"],
+                result["width_cm"],
+                result["depth_cm"],
+                result["diameter_cm"],
+                result["weight_g"],
+                result["dimension_note"],
+                result["narrative_text"],
+                result["date_earliest"],
+                result["date_latest"],
+                result["date_display"],
+                result["current_location"],
+                result["provenance_text_hash"],
+                result["title_all_text"],
+                result.get("creator_label"),
+                result.get("record_created"),
+                result.get("record_modified"),
+                result.get("visualitem_uri"),
+                obj_num,
+            ))
+            if result.get("record_created") or result.get("record_modified"):
+                with_record_timestamp += 1
+
+            # Insert production role, attribution qualifier, creator, place, and source type mappings
+            mapping_rows.extend(
+                (obj_num, vocab_id, field)
+                for vocab_id, field in chain(result["roles"], result["qualifiers"], result["creators"], result["places"], result["source_types"])
+            )
+            role_count += len(result["roles"])
+            qualifier_count += len(result["qualifiers"])
+            creator_count += len(result["creators"])
+            place_count += len(result["places"])
+            source_type_count += len(result["source_types"])
+
+            # New-table inserts require art_id. The bootstrap block at the top
+            # of run_phase4 guarantees art_id exists, so has_art_id should be
+            # True — but keep the fallback so this function stays robust if
+            # the bootstrap is ever disabled or the caller reshapes the schema.
+            art_id = art_id_map.get(obj_num) if has_art_id else None
+
+            if art_id is not None:
+                # Insert modifications
+                conn.executemany(
+                    "INSERT OR IGNORE INTO modifications (art_id, seq, modifier_uri, date_display, date_begin, date_end, description) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(art_id, seq, mod["modifier_uri"], mod["date_display"], mod["date_begin"], mod["date_end"], mod["description"])
+                     for seq, mod in enumerate(result.get("modifications", []))],
+                )
+                modification_count += len(result.get("modifications", []))
 
-                    # Insert examinations
-                    for seq, exam in enumerate(result.get("examinations", [])):
-                        conn.execute(
-                            "INSERT OR IGNORE INTO examinations (art_id, seq, examiner_name, report_type_id, report_type_en, date_display, date_begin, date_end) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                            (art_id, seq, exam["examiner_name"], exam["report_type_id"], exam.get("report_type_en"), exam.get("date_display"), exam.get("date_begin"), exam.get("date_end")),
-                        )
-                    examination_count += len(result.get("examinations", []))
+                # Insert related objects
+                conn.executemany(
+                    "INSERT OR IGNORE INTO related_objects (art_id, related_la_uri, relationship_en, relationship_nl) VALUES (?, ?, ?, ?)",
+                    [(art_id, ro["related_la_uri"], ro["relationship_en"], ro.get("relationship_nl"))
+                     for ro in result.get("related_objects", [])],
+                )
+                related_object_count += len(result.get("related_objects", []))
 
-                    # Insert title variants
-                    for seq, tv in enumerate(result.get("title_variants", [])):
-                        conn.execute(
-                            "INSERT OR IGNORE INTO title_variants (art_id, seq, title_text, language, qualifier) VALUES (?, ?, ?, ?, ?)",
-                            (art_id, seq, tv["title_text"], tv.get("language"), tv.get("qualifier")),
-                        )
-                    title_variant_count += len(result.get("title_variants", []))
+                # Insert examinations
+                conn.executemany(
+                    "INSERT OR IGNORE INTO examinations (art_id, seq, examiner_name, report_type_id, report_type_en, date_display, date_begin, date_end) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(art_id, seq, exam["examiner_name"], exam["report_type_id"], exam.get("report_type_en"), exam.get("date_display"), exam.get("date_begin"), exam.get("date_end"))
+                     for seq, exam in enumerate(result.get("examinations", []))],
+                )
+                examination_count += len(result.get("examinations", []))
 
-                    # Insert assignment pairs
-                    for q_id, c_id, part_idx in result.get("assignment_pairs", []):
-                        conn.execute(
-                            "INSERT OR IGNORE INTO assignment_pairs (artwork_id, qualifier_id, creator_id, part_index) VALUES (?, ?, ?, ?)",
-                            (art_id, q_id, c_id, part_idx),
-                        )
-                    assignment_pair_count += len(result.get("assignment_pairs", []))
+                # Insert title variants
+                conn.executemany(
+                    "INSERT OR IGNORE INTO title_variants (art_id, seq, title_text, language, qualifier) VALUES (?, ?, ?, ?, ?)",
+                    [(art_id, seq, tv["title_text"], tv.get("language"), tv.get("qualifier"))
+                     for seq, tv in enumerate(result.get("title_variants", []))],
+                )
+                title_variant_count += len(result.get("title_variants", []))
 
-                    # Insert parent URIs
-                    for parent_uri in result.get("parent_uris", []):
-                        conn.execute(
-                            "INSERT OR IGNORE INTO artwork_parent (art_id, parent_la_uri) VALUES (?, ?)",
-                            (art_id, parent_uri),
-                        )
-                    parent_count += len(result.get("parent_uris", []))
+                # Insert assignment pairs
+                conn.executemany(
+                    "INSERT OR IGNORE INTO assignment_pairs (artwork_id, qualifier_id, creator_id, part_index) VALUES (?, ?, ?, ?)",
+                    [(art_id, q_id, c_id, part_idx)
+                     for q_id, c_id, part_idx in result.get("assignment_pairs", [])],
+                )
+                assignment_pair_count += len(result.get("assignment_pairs", []))
 
-                    evidence = result.get("attribution_evidence")
-                    if evidence:
-                        conn.executemany(
-                            "INSERT OR IGNORE INTO attribution_evidence "
-                            "(art_id, part_index, evidence_type_aat, carried_by_uri, label_text) "
-                            "VALUES (?, ?, ?, ?, ?)",
-                            [
-                                (art_id, ev["part_index"], ev["evidence_type_aat"],
-                                 ev["carried_by_uri"], ev["label_text"])
-                                for ev in evidence
-                            ],
-                        )
-                        attribution_evidence_count += len(evidence)
+                # Insert parent URIs
+                conn.executemany(
+                    "INSERT OR IGNORE INTO artwork_parent (art_id, parent_la_uri) VALUES (?, ?)",
+                    [(art_id, parent_uri) for parent_uri in result.get("parent_uris", [])],
+                )
+                parent_count += len(result.get("parent_uris", []))
 
-                    ext_ids = result.get("artwork_external_ids")
-                    if ext_ids:
-                        conn.executemany(
-                            "INSERT OR IGNORE INTO artwork_external_ids "
-                            "(art_id, authority, id, uri) VALUES (?, ?, ?, ?)",
-                            [(art_id, auth, lid, uri) for auth, lid, uri in ext_ids],
-                        )
-                        artwork_external_id_count += len(ext_ids)
-
-                    # Bibliography citations from object-level assigned_by[].
-                    # raw_citations are extracted in resolve_artwork (pure, thread-safe);
-                    # publication resolution runs here in the main thread via _pub_cache.
-                    raw_cits = result.get("raw_citations") or []
-                    if raw_cits and has_citations_table:
-                        composed = []
-                        for rc in raw_cits:
-                            pub = None
-                            if rc.get("publication_id") is not None:
-                                pub = _resolve_publication(rc["publication_id"])
-                            row = compose_citation(rc, pub)
-                            composed.append(row)
-                        if composed:
-                            conn.executemany(CITATION_INSERT_SQL, citation_rows(art_id, composed))
-                            citation_count += len(composed)
-
-                # Thematic vocab mappings (field='theme'). Uses MAPPING_INSERT_SQL
-                # like other vocab fields; orphan vocab_ids (entity not yet
-                # harvested) are silently dropped during integer encoding.
-                about_ids = result.get("about_vocab_ids")
-                if about_ids:
+                evidence = result.get("attribution_evidence")
+                if evidence:
                     conn.executemany(
-                        MAPPING_INSERT_SQL,
-                        [(obj_num, vid, "theme") for vid in about_ids],
+                        "INSERT OR IGNORE INTO attribution_evidence "
+                        "(art_id, part_index, evidence_type_aat, carried_by_uri, label_text) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (art_id, ev["part_index"], ev["evidence_type_aat"],
+                             ev["carried_by_uri"], ev["label_text"])
+                            for ev in evidence
+                        ],
                     )
-                    about_count += len(about_ids)
+                    attribution_evidence_count += len(evidence)
 
-            conn.commit()
-            batch_start = batch_end
-
-            elapsed = time.time() - t0
-            rate = processed / elapsed if elapsed > 0 else 0
-            remaining = (total - processed) / rate if rate > 0 else 0
-            print(
-                f"  {processed:,}/{total:,} ({succeeded:,} ok, {failed:,} failed, {not_found:,} 404, "
-                f"{rate:.0f}/s, ~{remaining / 60:.0f}min left)",
-                flush=True,
-            )
+                ext_ids = result.get("artwork_external_ids")
+                if ext_ids:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO artwork_external_ids "
+                        "(art_id, authority, id, uri) VALUES (?, ?, ?, ?)",
+                        [(art_id, auth, lid, uri) for auth, lid, uri in ext_ids],
+                    )
+                    artwork_external_id_count += len(ext_ids)
+
+                # Bibliography citations from object-level assigned_by[].
+                # raw_citations are extracted in resolve_artwork (pure, thread-safe);
+                # publication resolution runs here in the main thread via _pub_cache.
+                raw_cits = result.get("raw_citations") or []
+                if raw_cits and has_citations_table:
+                    composed = []
+                    for rc in raw_cits:
+                        pub = None
+                        if rc.get("publication_id") is not None:
+                            pub = _resolve_publication(rc["publication_id"])
+                        row = compose_citation(rc, pub)
+                        composed.append(row)
+                    if composed:
+                        conn.executemany(CITATION_INSERT_SQL, citation_rows(art_id, composed))
+                        citation_count += len(composed)
+
+            # Thematic vocab mappings (field='theme'). Uses MAPPING_INSERT_SQL
+            # like other vocab fields; orphan vocab_ids (entity not yet
+            # harvested) are silently dropped during integer encoding.
+            about_ids = result.get("about_vocab_ids")
+            if about_ids:
+                mapping_rows.extend((obj_num, vid, "theme") for vid in about_ids)
+                about_count += len(about_ids)
+
+    flush_writes()
+    report_progress()
 
     elapsed = time.time() - t0
     print(f"\n  Phase 4 complete in {elapsed / 60:.1f}min:")
@@ -3745,7 +4154,7 @@ def _fetch_visualitem_about(uri: str) -> tuple[str, list[str] | None]:
     if not resp.ok:
         return uri, None
     try:
-        data = resp.json()
+        data = json_loads(resp.content)
     except ValueError:
         return uri, None
     return uri, extract_about(data)
@@ -3778,6 +4187,7 @@ def run_phase4_5(conn: sqlite3.Connection, threads: int = DEFAULT_THREADS):
 
     int_mappings = "field_id" in get_columns(conn, "mappings")
     insert_sql = _mapping_insert_sql(int_mappings)
+    encode_mappings = _mapping_row_encoder(conn, int_mappings)
 
     print(f"  Resolving {total:,} VisualItems for thematic vocab ({threads} threads)...")
     t0 = time.time()
@@ -3791,42 +4201,43 @@ def run_phase4_5(conn: sqlite3.Connection, threads: int = DEFAULT_THREADS):
     pending: list[tuple[str, str, str]] = []
 
     with ThreadPoolExecutor(max_workers=threads) as pool:
-        for batch_start in range(0, total, batch_size):
-            batch = rows[batch_start:batch_start + batch_size]
-            futures = {pool.submit(_fetch_visualitem_about, vi): obj for obj, vi in batch}
-            for future in as_completed(futures):
-                obj_num = futures[future]
-                processed += 1
-                try:
-                    _, about_ids = future.result()
-                except Exception:
-                    failed += 1
-                    continue
-                if about_ids is None:
-                    failed += 1
-                    continue
-                if not about_ids:
-                    no_themes += 1
-                    continue
-                with_themes += 1
-                for vocab_id in about_ids:
-                    pending.append((obj_num, vocab_id, "theme"))
-                total_theme_rows += len(about_ids)
-
-            conn.executemany(insert_sql, pending)
-            conn.commit()
-            pending.clear()
+        for (obj_num, _vi), future in iter_completed(
+            pool, _fetch_visualitem_about, rows, window=2 * threads, arg=lambda r: r[1],
+        ):
+            if processed and processed % batch_size == 0:
+                conn.executemany(insert_sql, encode_mappings(pending))
+                conn.commit()
+                pending.clear()
+
+                if (processed // batch_size) % 20 == 1:
+                    elapsed = time.time() - t0
+                    rate = processed / elapsed if elapsed > 0 else 0
+                    remaining = (total - processed) / rate if rate > 0 else 0
+                    print(
+                        f"    {processed:,}/{total:,} ({with_themes:,} with themes, "
+                        f"{failed:,} failed, {no_themes:,} no-themes, "
+                        f"{rate:.0f}/s, ~{remaining / 60:.0f}min left)",
+                        flush=True,
+                    )
+            processed += 1
+            try:
+                _, about_ids = future.result()
+            except Exception:
+                failed += 1
+                continue
+            if about_ids is None:
+                failed += 1
+                continue
+            if not about_ids:
+                no_themes += 1
+                continue
+            with_themes += 1
+            for vocab_id in about_ids:
+                pending.append((obj_num, vocab_id, "theme"))
+            total_theme_rows += len(about_ids)
 
-            if (batch_start // batch_size) % 20 == 0 and processed > 0:
-                elapsed = time.time() - t0
-                rate = processed / elapsed if elapsed > 0 else 0
-                remaining = (total - processed) / rate if rate > 0 else 0
-                print(
-                    f"    {processed:,}/{total:,} ({with_themes:,} with themes, "
-                    f"{failed:,} failed, {no_themes:,} no-themes, "
-                    f"{rate:.0f}/s, ~{remaining / 60:.0f}min left)",
-                    flush=True,
-                )
+    conn.executemany(insert_sql, encode_mappings(pending))
+    conn.commit()
 
     elapsed = time.time() - t0
     print(f"\n  Phase 4.5 complete in {elapsed / 60:.1f}min:")
@@ -3915,6 +4326,9 @@ def import_geocoding(conn: sqlite3.Connection, csv_path: str):
         for r in rows:
             existing_map[r[0]] = (r[1], r[2])
 
+    # One prepared UPDATE for every row, in CSV order: external_id is passed
+    # as NULL when it shouldn't change, and COALESCE keeps the stored value.
+    update_rows = []
     for vocab_id, lat, lon, ext_id, method_values in batch:
         existing = existing_map.get(vocab_id)
         if existing is None:
@@ -3927,32 +4341,24 @@ def import_geocoding(conn: sqlite3.Connection, csv_path: str):
 
         should_update_ext = ext_id and ext_id != existing[1]
         if should_update_ext:
-            conn.execute(
-                "UPDATE vocabulary "
-                "   SET lat = ?, lon = ?, "
-                "       geocode_method = 'csv', external_id = ?, "
-                "       coord_method = ?, coord_method_detail = ?, "
-                "       external_id_method = ?, external_id_method_detail = ?, "
-                "       broader_method = ?, broader_method_detail = ? "
-                " WHERE id = ?",
-                (lat, lon, ext_id, *method_values, vocab_id),
-            )
             updated_ext_id += 1
-        else:
-            conn.execute(
-                "UPDATE vocabulary "
-                "   SET lat = ?, lon = ?, "
-                "       geocode_method = 'csv', "
-                "       coord_method = ?, coord_method_detail = ?, "
-                "       external_id_method = ?, external_id_method_detail = ?, "
-                "       broader_method = ?, broader_method_detail = ? "
-                " WHERE id = ?",
-                (lat, lon, *method_values, vocab_id),
-            )
+        update_rows.append(
+            (lat, lon, ext_id if should_update_ext else None, *method_values, vocab_id)
+        )
         updated_coords += 1
         if has_method_cols and any(method_values):
             updated_method += 1
 
+    conn.executemany(
+        "UPDATE vocabulary "
+        "   SET lat = ?, lon = ?, "
+        "       geocode_method = 'csv', external_id = COALESCE(?, external_id), "
+        "       coord_method = ?, coord_method_detail = ?, "
+        "       external_id_method = ?, external_id_method_detail = ?, "
+        "       broader_method = ?, broader_method_detail = ? "
+        " WHERE id = ?",
+        update_rows,
+    )
     conn.commit()
     print(f"  Geocoding import complete:")
     print(f"    Coordinates updated: {updated_coords:,}")
@@ -4006,6 +4412,8 @@ def normalize_mappings(conn: sqlite3.Connection):
     # Step 3: Create and populate integer-encoded mappings table
     #   WITHOUT ROWID stores the composite INTEGER PK as a clustered B-tree,
     #   avoiding separate rowid allocation and saving ~50% vs regular table.
+    #   Rows are fed in PK order so each insert appends to the rightmost leaf
+    #   instead of splitting pages all over the clustered tree.
     print("  Building integer-encoded mappings table (this may take a few minutes)...")
     conn.execute("DROP TABLE IF EXISTS mappings_int")
     conn.execute("""
@@ -4023,6 +4431,7 @@ def normalize_mappings(conn: sqlite3.Connection):
         JOIN artworks a ON m.object_number = a.object_number
         JOIN vocabulary v ON m.vocab_id = v.id
         JOIN field_lookup f ON m.field = f.name
+        ORDER BY 1, 2, 3
     """)
     new_count = cur.execute("SELECT COUNT(*) FROM mappings_int").fetchone()[0]
     old_count = cur.execute("SELECT COUNT(*) FROM mappings").fetchone()[0]
@@ -4075,11 +4484,16 @@ def normalize_rights(conn: sqlite3.Connection):
     rights_count = conn.execute("SELECT COUNT(*) FROM rights_lookup").fetchone()[0]
     print(f"    {rights_count} distinct rights URIs")
 
+    # Rows without a rights URI keep the NULL the new column starts with, so
+    # only rows that get a value are rewritten. The subquery is a probe of
+    # rights_lookup's UNIQUE(uri) index (a handful of rows); rebuilding
+    # artworks via CREATE TABLE AS would drop its constraints and indexes.
     conn.execute("ALTER TABLE artworks ADD COLUMN rights_id INTEGER")
     conn.execute("""
         UPDATE artworks SET rights_id = (
             SELECT r.id FROM rights_lookup r WHERE r.uri = artworks.rights_uri
         )
+        WHERE rights_uri IS NOT NULL AND rights_uri != ''
     """)
     conn.commit()
 
@@ -4915,8 +5329,8 @@ def log_enrichment_stats(conn: sqlite3.Connection) -> None:
 def _create_enrichment_indexes(conn: sqlite3.Connection) -> None:
     """Create partial indexes on enriched columns, gated on data presence.
 
-    `idx_vocab_broader_id` is created earlier in run_phase3 (Part 1 of #242)
-    so it is not re-created here.
+    `idx_vocab_broader_id` is created by run_phase3 once enrichment has
+    finished (Part 1 of #242), so it is not created here.
     """
     index_specs = [
         (
@@ -5108,17 +5522,6 @@ def run_phase3(
             conn.execute(f"ALTER TABLE vocabulary ADD COLUMN {col_name} {col_type}")
     conn.commit()
 
-    # broader_id index: silences the `expandPlaceHierarchy will be slow` startup
-    # warning and makes nearPlace / place-hierarchy expansion fast on freshly-
-    # harvested DBs. Partial index is safe even when broader_id is all NULL
-    # (populated by enrich-vocab-from-dumps.py Phases 2c/2d). See issue #242.
-    if "broader_id" in vocab_cols:
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_vocab_broader_id "
-            "ON vocabulary(broader_id) WHERE broader_id IS NOT NULL"
-        )
-        conn.commit()
-
     # Import geocoding data if CSV provided
     if geo_csv:
         print("\n--- Geocoding Import ---")
@@ -5208,6 +5611,19 @@ def run_phase3(
     conn.commit()
     print(f"  [enrich tier] Tagged {tagged:,} rows broader_method='deterministic'")
 
+    # broader_id index: silences the `expandPlaceHierarchy will be slow` startup
+    # warning and makes nearPlace / place-hierarchy expansion fast on freshly-
+    # harvested DBs. Partial index is safe even when broader_id is all NULL
+    # (populated by enrichment Phases 2c/2d). Built here, after the enrichment
+    # writes, so it is created once from the final data instead of being
+    # maintained row by row through them. See issue #242.
+    if "broader_id" in get_columns(conn, "vocabulary"):
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_vocab_broader_id "
+            "ON vocabulary(broader_id) WHERE broader_id IS NOT NULL"
+        )
+        conn.commit()
+
     # ── Post-normalization joins (require art_id from normalize_mappings) ──
 
     # artwork_exhibitions junction table (from Phase 0 exhibition_members)
@@ -5436,22 +5852,35 @@ def run_phase3(
 
     print("\n--- Post-processing ---")
 
-    # Create vocab_term_counts table (preserves text vocab_id for topTermUris())
+    # Create vocab_term_counts table (preserves text vocab_id for topTermUris()).
+    # Aggregate the integer-only mappings first, then join the (much smaller)
+    # per-term counts to vocabulary for the text ID, rather than joining every
+    # mapping row before grouping. The table is clustered on (cnt DESC,
+    # vocab_id), so topTermUris()'s ORDER BY cnt DESC LIMIT ? is a plain
+    # table scan with no separate index to build or fetch through.
     print("  Building vocab_term_counts...")
     conn.execute("DROP TABLE IF EXISTS vocab_term_counts")
     conn.execute("""
-        CREATE TABLE vocab_term_counts AS
-        SELECT v.id AS vocab_id, COUNT(*) AS cnt
-        FROM mappings m
-        JOIN vocabulary v ON m.vocab_rowid = v.vocab_int_id
-        GROUP BY m.vocab_rowid
+        CREATE TABLE vocab_term_counts (
+            vocab_id TEXT NOT NULL,
+            cnt      INTEGER NOT NULL,
+            PRIMARY KEY (cnt DESC, vocab_id)
+        ) WITHOUT ROWID
     """)
-    conn.execute("CREATE INDEX idx_vtc_cnt ON vocab_term_counts(cnt DESC)")
-    vtc_count = cur.execute("SELECT COUNT(*) FROM vocab_term_counts").fetchone()[0]
+    vtc_count = conn.execute("""
+        INSERT INTO vocab_term_counts (vocab_id, cnt)
+        SELECT v.id, t.cnt
+        FROM (SELECT vocab_rowid, COUNT(*) AS cnt FROM mappings GROUP BY vocab_rowid) t
+        JOIN vocabulary v ON v.vocab_int_id = t.vocab_rowid
+        ORDER BY t.cnt DESC, v.id
+    """).rowcount
     print(f"    vocab_term_counts: {vtc_count:,} rows")
     conn.commit()
 
-    # Create FTS5 virtual table for vocabulary label search
+    # Create FTS5 virtual table for vocabulary label search. The FTS tables
+    # below are external-content and 'rebuild' indexes every content row, so
+    # row counts are taken from the content tables: COUNT(*) on the FTS table
+    # itself would read every content row back through the FTS5 module.
     print("  Building FTS5 index on vocabulary labels...")
     conn.execute("DROP TABLE IF EXISTS vocabulary_fts")
     conn.execute("""
@@ -5462,7 +5891,7 @@ def run_phase3(
         )
     """)
     conn.execute("INSERT INTO vocabulary_fts(vocabulary_fts) VALUES('rebuild')")
-    fts_count = cur.execute("SELECT COUNT(*) FROM vocabulary_fts").fetchone()[0]
+    fts_count = cur.execute("SELECT COUNT(*) FROM vocabulary").fetchone()[0]
     print(f"    vocabulary_fts: {fts_count:,} rows")
     conn.commit()
 
@@ -5481,8 +5910,7 @@ def run_phase3(
             )
         """)
         conn.execute("INSERT INTO person_names_fts(person_names_fts) VALUES('rebuild')")
-        pnf_count = cur.execute("SELECT COUNT(*) FROM person_names_fts").fetchone()[0]
-        print(f"    person_names_fts: {pnf_count:,} rows")
+        print(f"    person_names_fts: {pn_count:,} rows")
         conn.commit()
     else:
         print("  Skipping person_names_fts (no person name data yet)")
@@ -5497,8 +5925,7 @@ def run_phase3(
         conn.execute(
             "INSERT INTO entity_alt_names_fts(entity_alt_names_fts) VALUES('rebuild')"
         )
-        eanf_count = cur.execute("SELECT COUNT(*) FROM entity_alt_names_fts").fetchone()[0]
-        print(f"    entity_alt_names_fts: {eanf_count:,} rows")
+        print(f"    entity_alt_names_fts: {ean_count:,} rows")
         conn.commit()
     else:
         print("  Skipping entity_alt_names_fts (no rows yet)")
@@ -5534,16 +5961,19 @@ def run_phase3(
             )
         """)
         conn.execute("INSERT INTO artwork_texts_fts(artwork_texts_fts) VALUES('rebuild')")
-        atf_count = cur.execute("SELECT COUNT(*) FROM artwork_texts_fts").fetchone()[0]
+        atf_count = cur.execute("SELECT COUNT(*) FROM artworks").fetchone()[0]
         print(f"    artwork_texts_fts: {atf_count:,} rows")
         conn.commit()
     else:
         print("  Skipping artwork_texts_fts (no Tier 2 data yet)")
 
-    # Conditional indexes: only create when relevant data exists
+    # Conditional indexes: only create when relevant data exists. Each entry is
+    # (table, qualifying-row count expression, label, index DDL); the counts
+    # for one table are gathered in a single scan.
     conditional_indexes = [
         (
-            "SELECT COUNT(*) FROM artworks WHERE height_cm IS NOT NULL OR width_cm IS NOT NULL",
+            "artworks",
+            "COUNT(COALESCE(height_cm, width_cm))",
             "dimension indexes",
             [
                 "CREATE INDEX IF NOT EXISTS idx_artworks_height ON artworks(height_cm) WHERE height_cm IS NOT NULL",
@@ -5551,29 +5981,37 @@ def run_phase3(
             ],
         ),
         (
-            "SELECT COUNT(*) FROM artworks WHERE date_earliest IS NOT NULL",
+            "artworks",
+            "COUNT(date_earliest)",
             "date range index",
             [
                 "CREATE INDEX IF NOT EXISTS idx_artworks_date_range ON artworks(date_earliest, date_latest) WHERE date_earliest IS NOT NULL",
             ],
         ),
         (
-            "SELECT COUNT(*) FROM artworks WHERE record_modified IS NOT NULL",
+            "artworks",
+            "COUNT(record_modified)",
             "record_modified index",
             [
                 "CREATE INDEX IF NOT EXISTS idx_artworks_record_modified ON artworks(record_modified) WHERE record_modified IS NOT NULL",
             ],
         ),
         (
-            "SELECT COUNT(*) FROM vocabulary WHERE lat IS NOT NULL",
+            "vocabulary",
+            "COUNT(lat)",
             "geo index",
             [
                 "CREATE INDEX IF NOT EXISTS idx_vocab_lat_lon ON vocabulary(lat, lon) WHERE lat IS NOT NULL",
             ],
         ),
     ]
-    for count_sql, label, index_sqls in conditional_indexes:
-        count = cur.execute(count_sql).fetchone()[0]
+    qualifying: dict[tuple[str, str], int] = {}
+    for table in dict.fromkeys(t for t, *_ in conditional_indexes):
+        exprs = [expr for t, expr, *_ in conditional_indexes if t == table]
+        row = cur.execute(f"SELECT {', '.join(exprs)} FROM {table}").fetchone()
+        qualifying.update(((table, expr), n) for expr, n in zip(exprs, row))
+    for table, count_expr, label, index_sqls in conditional_indexes:
+        count = qualifying[(table, count_expr)]
         if count > 0:
             print(f"  Creating {label} — {count:,} qualifying rows...")
             for sql in index_sqls:
@@ -5587,35 +6025,30 @@ def run_phase3(
         "SELECT id FROM field_lookup WHERE name = 'collection_set'"
     ).fetchone()
     if set_field_id:
-        set_mappings = cur.execute(
-            "SELECT COUNT(*) FROM mappings WHERE field_id = ?", (set_field_id[0],)
-        ).fetchone()[0]
-        distinct_sets = cur.execute(
-            "SELECT COUNT(DISTINCT vocab_rowid) FROM mappings WHERE field_id = ?", (set_field_id[0],)
-        ).fetchone()[0]
+        set_mappings, distinct_sets = cur.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT vocab_rowid) FROM mappings WHERE field_id = ?",
+            (set_field_id[0],),
+        ).fetchone()
         print(f"    collection_set mappings: {set_mappings:,} ({distinct_sets:,} distinct sets)")
     else:
         print(f"    collection_set mappings: 0 (no collection_set field)")
 
-    # Rights coverage (via rights_lookup after normalization)
-    rights_total = cur.execute(
-        "SELECT COUNT(*) FROM artworks WHERE rights_id IS NOT NULL"
-    ).fetchone()[0]
-    rights_distinct = cur.execute(
-        "SELECT COUNT(DISTINCT rights_id) FROM artworks WHERE rights_id IS NOT NULL"
-    ).fetchone()[0]
-    print(f"    rights coverage: {rights_total:,} artworks ({rights_distinct:,} distinct URIs)")
-
-    # Show distinct rights URIs
-    print("\n--- Rights URIs ---")
-    rows = cur.execute("""
+    # Rights coverage (via rights_lookup after normalization). The per-URI
+    # counts for the report below also give the coverage totals, so artworks
+    # is aggregated once.
+    rights_rows = cur.execute("""
         SELECT r.uri, COUNT(*) as cnt
         FROM artworks a
         JOIN rights_lookup r ON a.rights_id = r.id
         GROUP BY a.rights_id
         ORDER BY cnt DESC
     """).fetchall()
-    for uri, cnt in rows:
+    rights_total = sum(cnt for _, cnt in rights_rows)
+    print(f"    rights coverage: {rights_total:,} artworks ({len(rights_rows):,} distinct URIs)")
+
+    # Show distinct rights URIs
+    print("\n--- Rights URIs ---")
+    for uri, cnt in rights_rows:
         print(f"  {cnt:8,}  {uri}")
 
     # Tier 2 stats
@@ -5641,25 +6074,37 @@ def run_phase3(
             ("date_display",     "Date display"),
             ("current_location", "Current loc."),
         ]
-        for col, label in text_cols:
-            cnt = cur.execute(f"SELECT COUNT(*) FROM artworks WHERE {col} IS NOT NULL AND {col} != ''").fetchone()[0]
-            print(f"  {label:20s} {cnt:8,} artworks")
-        for col, label in non_null_cols:
-            cnt = cur.execute(f"SELECT COUNT(*) FROM artworks WHERE {col} IS NOT NULL").fetchone()[0]
+        # One scan of artworks for all columns: COUNT(NULLIF(col, '')) counts
+        # non-NULL, non-empty text; COUNT(col) counts non-NULL values.
+        coverage_exprs = (
+            [f"COUNT(NULLIF({col}, ''))" for col, _ in text_cols]
+            + [f"COUNT({col})" for col, _ in non_null_cols]
+        )
+        counts = cur.execute(f"SELECT {', '.join(coverage_exprs)} FROM artworks").fetchone()
+        for (_col, label), cnt in zip(text_cols + non_null_cols, counts):
             print(f"  {label:20s} {cnt:8,} artworks")
 
-        # Mapping field coverage
-        for field, label in [("production_role", "Prod. roles"), ("attribution_qualifier", "Attr. qualifiers"), ("creator", "Creators")]:
-            fid = cur.execute("SELECT id FROM field_lookup WHERE name = ?", (field,)).fetchone()
-            if fid:
-                cnt = cur.execute(
-                    "SELECT COUNT(*) FROM mappings WHERE field_id = ?", (fid[0],)
-                ).fetchone()[0]
-                artworks = cur.execute(
-                    "SELECT COUNT(DISTINCT artwork_id) FROM mappings WHERE field_id = ?", (fid[0],)
-                ).fetchone()[0]
-            else:
-                cnt, artworks = 0, 0
+        # Mapping field coverage: one grouped pass over the fields' index
+        # ranges; fields missing from field_lookup report zero.
+        mapping_fields = [
+            ("production_role",       "Prod. roles"),
+            ("attribution_qualifier", "Attr. qualifiers"),
+            ("creator",               "Creators"),
+        ]
+        field_names = [field for field, _ in mapping_fields]
+        placeholders = ", ".join("?" * len(field_names))
+        field_stats = {
+            name: (cnt, artworks)
+            for name, cnt, artworks in cur.execute(f"""
+                SELECT f.name, COUNT(*), COUNT(DISTINCT m.artwork_id)
+                FROM mappings m
+                JOIN field_lookup f ON f.id = m.field_id
+                WHERE m.field_id IN (SELECT id FROM field_lookup WHERE name IN ({placeholders}))
+                GROUP BY m.field_id
+            """, field_names)
+        }
+        for field, label in mapping_fields:
+            cnt, artworks = field_stats.get(field, (0, 0))
             print(f"  {label:20s} {cnt:8,} mappings ({artworks:,} artworks)")
 
         # Creator label coverage (should increase from ~55% to ~95%+ after assigned_by extraction)
@@ -5702,49 +6147,65 @@ def run_phase3(
     """).fetchone()[0]
     print(f"  Iconclass 34B11 (dog): {count:,} artworks")
 
-    # Crucifixion
-    count = cur.execute("""
+    # Label samples: vocabulary_fts (built above) narrows the candidates to
+    # label_en token-prefix hits; the LIKE only re-checks those candidates.
+    # These are therefore token-prefix counts: a label with the term inside
+    # a word (e.g. "…-crucifixion") is not counted, so the numbers can sit
+    # below those of the old full-scan LIKE '%term%' without any data loss.
+    # Mappings has no vocab_rowid-leading index, so the field_id IN (...)
+    # term lets each hit probe idx_mappings_field_vocab instead of forcing a
+    # full mappings scan.
+    label_sample_sql = """
         SELECT COUNT(DISTINCT m.artwork_id)
-        FROM mappings m
-        JOIN vocabulary v ON m.vocab_rowid = v.vocab_int_id
-        WHERE v.label_en LIKE '%crucifixion%'
-    """).fetchone()[0]
+        FROM vocabulary_fts f
+        JOIN vocabulary v ON v.rowid = f.rowid
+        JOIN mappings m ON m.field_id IN ({fields}) AND m.vocab_rowid = v.vocab_int_id
+        WHERE vocabulary_fts MATCH ? AND v.label_en LIKE ?{type_filter}
+    """
+
+    # Crucifixion
+    count = cur.execute(
+        label_sample_sql.format(fields="SELECT id FROM field_lookup", type_filter=""),
+        ("label_en: crucifixion*", "%crucifixion%"),
+    ).fetchone()[0]
     print(f"  Subject 'crucifixion': {count:,} artworks")
 
     # Rembrandt as depicted person
     subject_fid = cur.execute("SELECT id FROM field_lookup WHERE name = 'subject'").fetchone()
     if subject_fid:
-        count = cur.execute("""
-            SELECT COUNT(DISTINCT m.artwork_id)
-            FROM mappings m
-            JOIN vocabulary v ON m.vocab_rowid = v.vocab_int_id
-            WHERE m.field_id = ? AND v.type = 'person'
-              AND v.label_en LIKE '%Rembrandt%'
-        """, (subject_fid[0],)).fetchone()[0]
+        count = cur.execute(
+            label_sample_sql.format(fields="?", type_filter=" AND v.type = 'person'"),
+            (subject_fid[0], "label_en: Rembrandt*", "%Rembrandt%"),
+        ).fetchone()[0]
     else:
         count = 0
     print(f"  Depicted person 'Rembrandt': {count:,} artworks")
 
     # Amsterdam
-    count = cur.execute("""
-        SELECT COUNT(DISTINCT m.artwork_id)
-        FROM mappings m
-        JOIN vocabulary v ON m.vocab_rowid = v.vocab_int_id
-        WHERE v.type = 'place' AND v.label_en LIKE '%Amsterdam%'
-    """).fetchone()[0]
+    count = cur.execute(
+        label_sample_sql.format(fields="SELECT id FROM field_lookup", type_filter=" AND v.type = 'place'"),
+        ("label_en: Amsterdam*", "%Amsterdam%"),
+    ).fetchone()[0]
     print(f"  Place 'Amsterdam': {count:,} artworks")
 
     print("\n--- Top 10 Subjects ---")
     if subject_fid:
+        # Rank on the covering idx_mappings_field_vocab alone and join only
+        # the 10 winners to vocabulary. The mappings PK makes artwork_id
+        # unique per (field_id, vocab_rowid), so COUNT(*) is COUNT(DISTINCT).
         rows = cur.execute("""
-            SELECT v.notation, v.label_en, v.label_nl, v.type,
-                   COUNT(DISTINCT m.artwork_id) as cnt
-            FROM mappings m
-            JOIN vocabulary v ON m.vocab_rowid = v.vocab_int_id
-            WHERE m.field_id = ?
-            GROUP BY m.vocab_rowid
-            ORDER BY cnt DESC
-            LIMIT 10
+            WITH top AS (
+                SELECT vocab_rowid, COUNT(*) AS cnt
+                FROM mappings
+                WHERE field_id = ?
+                GROUP BY vocab_rowid
+                ORDER BY cnt DESC
+                LIMIT 10
+            )
+            SELECT v.notation, v.label_en, v.label_nl, v.type, t.cnt
+            FROM top t
+            JOIN vocabulary v ON v.vocab_int_id = t.vocab_rowid
+            ORDER BY t.cnt DESC
         """, (subject_fid[0],)).fetchall()
     else:
         rows = []
@@ -5793,11 +6254,32 @@ def run_phase3(
     for k, v in version_rows:
         print(f"  {k}: {v}")
 
+    # Merge each FTS5 index down to a single b-tree segment: the shipped DB is
+    # read-only, so MATCH never has to visit the segments 'rebuild' leaves
+    # behind. Runs before VACUUM so the merged-away pages are reclaimed.
+    print("\n--- FTS5 Optimize ---")
+    for fts_table in ("vocabulary_fts", "person_names_fts",
+                      "entity_alt_names_fts", "artwork_texts_fts"):
+        if table_exists(conn, fts_table):
+            t0 = time.time()
+            conn.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES('optimize')")
+            conn.commit()
+            print(f"  {fts_table}: {time.time() - t0:.1f}s")
+
     # Final VACUUM to reclaim space from dropped tables/columns
+    restore_safe_pragmas(conn)
     print("\n--- VACUUM ---")
-    t0 = time.time()
-    conn.execute("VACUUM")
-    print(f"  VACUUM complete in {time.time() - t0:.1f}s")
+    free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    total_pages = conn.execute("PRAGMA page_count").fetchone()[0]
+    free_ratio = free_pages / total_pages if total_pages else 0.0
+    if free_ratio < VACUUM_MIN_FREE_RATIO:
+        print(f"  Skipping VACUUM: {free_pages:,}/{total_pages:,} pages free "
+              f"({free_ratio:.1%} < {VACUUM_MIN_FREE_RATIO:.0%})")
+    else:
+        t0 = time.time()
+        conn.execute("VACUUM")
+        print(f"  VACUUM complete in {time.time() - t0:.1f}s "
+              f"({free_pages:,}/{total_pages:,} pages were free)")
 
     if audit_results is not None:
         phase3_audit = run_phase_audit(conn, "phase3")
@@ -5904,6 +6386,7 @@ def main():
     # Phase ordering: 0 → 0.5 → 1 → 2 → 4 → 2b → 3
     # Phase 2b re-resolves after Phase 4 (which introduces new vocab refs).
     # Phase 3 runs last because it builds FTS indexes and stats on all data.
+    bulk_load_pragmas(conn)
 
     if args.start_phase <= 0 and not args.skip_dump:
         print("=== Phase 0: Parsing data dumps ===")
@@ -5928,7 +6411,9 @@ def main():
         label = f"Harvesting OAI-PMH records (limit: {args.limit_pages} pages)" if args.limit_pages else "Harvesting ALL OAI-PMH records"
         print(f"=== Phase 1: {label} ===")
         t0 = time.time()
+        prepare_phase1_schema(conn)
         run_phase1(conn, resume=args.resume, max_pages=args.limit_pages)
+        finalize_phase1_schema(conn)
         PHASE_DURATIONS["phase1"] = time.time() - t0
         print(f"  Phase 1 took {PHASE_DURATIONS['phase1']:.1f}s")
         print()
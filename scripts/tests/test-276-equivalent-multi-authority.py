@@ -5,6 +5,7 @@ Run: ~/miniconda3/envs/embeddings/bin/python scripts/tests/test-276-equivalent-m
 """
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -21,13 +22,13 @@ def _mock_la_response(equivalent: list[dict], la_type: str = "Person",
     resp = MagicMock()
     resp.status_code = 200
     resp.ok = True
-    resp.json.return_value = {
+    resp.content = json.dumps({
         "type": la_type,
         "equivalent": equivalent,
         "identified_by": identified_by or [
             {"content": "Test", "type": "Name", "language": []}
         ],
-    }
+    }).encode()
     return resp
 
 
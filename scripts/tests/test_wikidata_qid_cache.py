@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Smoke test for the Phase 3b Wikidata QID cache in geocode_places.
+
+Verifies that validate_candidates_sparql:
+  1. Writes validated QIDs to the cache file on a cold run.
+  2. Serves fresh entries from the cache on the next run and only sends the
+     misses to SPARQL, preserving the qid_info dict shape.
+  3. Ignores entries older than QID_CACHE_MAX_AGE_S.
+  4. Bypasses the cache under refresh=True.
+
+sparql_query and time.sleep are monkey-patched; no network access.
+
+Run: python3 scripts/tests/test_wikidata_qid_cache.py
+"""
+from __future__ import annotations
+
+import importlib.util
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPT_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _test_helpers import CheckRecorder  # noqa: E402
+
+
+def load_geocode_module():
+    spec = importlib.util.spec_from_file_location(
+        "geocode_places", SCRIPT_DIR / "geocoding" / "geocode_places.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _binding(qid: str) -> dict:
+    return {
+        "item": {"value": f"http://www.wikidata.org/entity/{qid}"},
+        "types": {"value": "http://www.wikidata.org/entity/Q515 "
+                           "http://www.wikidata.org/entity/Q486972"},
+        "country_": {"value": "http://www.wikidata.org/entity/Q55"},
+        "point": {"value": "Point(4.5 52.0)"},
+        "label_": {"value": f"label-{qid}"},
+    }
+
+
+def install_fake_sparql(gp) -> list[set[str]]:
+    """Replace sparql_query; return a list recording the QIDs per call."""
+    calls: list[set[str]] = []
+
+    def fake_sparql(endpoint, query, retries=3):
+        qids = {tok[3:] for tok in query.split() if tok.startswith("wd:Q")}
+        calls.append(qids)
+        return [_binding(q) for q in sorted(qids)]
+
+    gp.sparql_query = fake_sparql
+    gp.time.sleep = lambda _s: None
+    return calls
+
+
+def run_test_cache_roundtrip(gp, check: CheckRecorder, tmp: Path) -> None:
+    calls = install_fake_sparql(gp)
+    cache_path = tmp / gp.QID_CACHE_FILENAME
+    cands = {"v1": [{"qid": "Q1"}, {"qid": "Q2"}]}
+
+    cold = gp.validate_candidates_sparql(cands, cache_path=cache_path)
+    check.check("cold: one SPARQL call for both QIDs",
+                calls == [{"Q1", "Q2"}], detail=f"got {calls}")
+    check.check("cold: cache file written", cache_path.exists())
+
+    calls.clear()
+    cands["v2"] = [{"qid": "Q3"}]
+    warm = gp.validate_candidates_sparql(cands, cache_path=cache_path)
+    check.check("warm: only the miss is queried",
+                calls == [{"Q3"}], detail=f"got {calls}")
+    check.check("cold: aggregated row parsed",
+                cold["Q1"]["lat"] == 52.0 and cold["Q1"]["lon"] == 4.5
+                and sorted(cold["Q1"]["types"]) == ["Q486972", "Q515"]
+                and cold["Q1"]["country_qid"] == "Q55",
+                detail=f"got {cold['Q1']!r}")
+    check.check("warm: cached entries round-trip unchanged",
+                {**warm["Q1"], "types": sorted(warm["Q1"]["types"])}
+                == {**cold["Q1"], "types": sorted(cold["Q1"]["types"])},
+                detail=f"cold={cold['Q1']!r} warm={warm['Q1']!r}")
+    check.check("warm: all three QIDs returned",
+                set(warm) == {"Q1", "Q2", "Q3"}, detail=f"got {set(warm)}")
+
+    calls.clear()
+    gp.validate_candidates_sparql(cands, cache_path=cache_path, refresh=True)
+    check.check("refresh: cache bypassed",
+                calls == [{"Q1", "Q2", "Q3"}], detail=f"got {calls}")
+
+
+def run_test_stale_entries_refetched(gp, check: CheckRecorder,
+                                     tmp: Path) -> None:
+    calls = install_fake_sparql(gp)
+    cache_path = tmp / "stale.db"
+    gp.validate_candidates_sparql({"v1": [{"qid": "Q9"}]},
+                                  cache_path=cache_path)
+    conn = sqlite3.connect(str(cache_path))
+    conn.execute("UPDATE wd_cache SET fetched_at = fetched_at - ?",
+                 (gp.QID_CACHE_MAX_AGE_S + 1,))
+    conn.commit()
+    conn.close()
+
+    calls.clear()
+    gp.validate_candidates_sparql({"v1": [{"qid": "Q9"}]},
+                                  cache_path=cache_path)
+    check.check("stale: expired entry re-queried",
+                calls == [{"Q9"}], detail=f"got {calls}")
+
+
+def main() -> int:
+    gp = load_geocode_module()
+    check = CheckRecorder()
+    with tempfile.TemporaryDirectory() as d:
+        run_test_cache_roundtrip(gp, check, Path(d))
+        run_test_stale_entries_refetched(gp, check, Path(d))
+    print(check.summary())
+    for fail in check.failures:
+        print(f"  FAIL: {fail}")
+    return check.exit_code()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
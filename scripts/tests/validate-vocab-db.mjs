@@ -331,7 +331,6 @@ const requiredIndexes = [
   "idx_vocab_notation",
   "idx_vocab_type",
   "idx_vocab_lat_lon",
-  "idx_vtc_cnt",
   "idx_person_names_id",
 ];
 for (const idx of requiredIndexes) {